@@ -0,0 +1,218 @@
+"""
+Archive.py: Move old completed work out of the hot tables into an attached archive database.
+Alec Shellberg
+10/18/2026
+"""
+
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+
+from IT_Task_Manager.Database_Tier import ARCHIVE_SCHEMA, MAX_IDS_PER_STATEMENT, bump_generation
+from IT_Task_Manager.config import archive_path
+
+# tasks moved per transaction; each batch holds the write lock only briefly
+ARCHIVE_BATCH = 500
+# default age, in days since completion, of the work archive jobs move
+ARCHIVE_AFTER_DAYS = 90
+
+
+def attach_archive(conn, path=archive_path):
+    """
+    Attach the archive database as ARCHIVE_SCHEMA, creating its tables on first use. A no-op when already attached.
+    :param conn: Connection
+    :param path: String
+    :return: None
+    """
+    with closing(conn.cursor()) as cursor:
+        cursor.execute("PRAGMA database_list")
+        if any(row[1] == ARCHIVE_SCHEMA for row in cursor.fetchall()):
+            return
+        cursor.execute("ATTACH DATABASE ? AS " + ARCHIVE_SCHEMA, (path,))
+        cursor.execute("PRAGMA " + ARCHIVE_SCHEMA + ".journal_mode=WAL")
+        cursor.execute("CREATE TABLE IF NOT EXISTS " + ARCHIVE_SCHEMA + ".Task("
+                       "id INTEGER PRIMARY KEY,"
+                       "customer_name VARCHAR(60) NOT NULL,"
+                       "job_description VARCHAR(100) NOT NULL,"
+                       "price REAL NOT NULL,"
+                       "estimated_hours REAL NOT NULL)")
+        cursor.execute("CREATE TABLE IF NOT EXISTS " + ARCHIVE_SCHEMA + ".Assignment("
+                       "id INTEGER PRIMARY KEY,"
+                       "employee_id INTEGER NOT NULL,"
+                       "task_id INTEGER NOT NULL,"
+                       "completed INTEGER NOT NULL,"
+                       "completed_at TIMESTAMP)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS " + ARCHIVE_SCHEMA + ".idx_archive_assignment_task "
+                       "ON Assignment(task_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS " + ARCHIVE_SCHEMA + ".idx_archive_assignment_employee "
+                       "ON Assignment(employee_id, completed)")
+        # completed work moved out of the hot Employee_Workload summary, so reports can add it back
+        cursor.execute("CREATE TABLE IF NOT EXISTS " + ARCHIVE_SCHEMA + ".Employee_Workload("
+                       "employee_id INTEGER PRIMARY KEY,"
+                       "completed_count INTEGER NOT NULL DEFAULT 0,"
+                       "completed_price REAL NOT NULL DEFAULT 0,"
+                       "completed_hours REAL NOT NULL DEFAULT 0)")
+        conn.commit()
+
+
+def detach_archive(conn):
+    """
+    :param conn: Connection
+    :return: None
+    """
+    with closing(conn.cursor()) as cursor:
+        cursor.execute("DETACH DATABASE " + ARCHIVE_SCHEMA)
+
+
+def cutoff_days_ago(days):
+    """
+    :param days: float
+    :return: String timestamp in the UTC format CURRENT_TIMESTAMP writes to completed_at
+    """
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def archive_batch(conn, cutoff, after_task_id=0, batch_size=ARCHIVE_BATCH):
+    """
+    Move up to batch_size tasks whose assignments were all completed before cutoff, together with
+    those assignments, into the archive. Tasks with open or recent work stay put.
+    A transaction spanning two WAL databases is only atomic per file, so each step writes one file:
+    the rows are copied into the archive and committed, then deleted from main only where an identical
+    archived copy exists, then archived copies of tasks still in main within the batch's id range are
+    dropped again. A crash between steps leaves rows in both databases, never in neither, and the next
+    run over that range cleans it up; the archived workload only counts rows when they are first copied.
+    :param conn: Connection with the archive attached
+    :param cutoff: String timestamp compared with completed_at
+    :param after_task_id: int only consider tasks with a larger id; pass the previous batch's last id
+    :param batch_size: int
+    :return: (int tasks moved, int assignments moved, int last task id or None when nothing was left)
+    """
+    batch_size = min(batch_size, MAX_IDS_PER_STATEMENT)
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT task_id FROM main.Assignment WHERE task_id > ? GROUP BY task_id "
+                           "HAVING min(completed) = 1 AND max(completed_at) < ? ORDER BY task_id LIMIT ?",
+                           (after_task_id, cutoff, batch_size))
+            task_ids = [row[0] for row in cursor.fetchall()]
+            archived = []
+            assignments = 0
+            if task_ids:
+                marks = "(" + ", ".join("?" * len(task_ids)) + ")"
+                copy_to_archive(cursor, marks, task_ids)
+                conn.commit()
+
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(ARCHIVED_TASKS_CMD + marks, task_ids)
+                archived = [row[0] for row in cursor.fetchall()]
+                if archived:
+                    archived_marks = "(" + ", ".join("?" * len(archived)) + ")"
+                    cursor.execute("DELETE FROM main.Assignment WHERE task_id IN " + archived_marks, archived)
+                    assignments = cursor.rowcount
+                    cursor.execute("DELETE FROM main.Task WHERE id IN " + archived_marks, archived)
+            conn.commit()
+
+            # archived copies of tasks still in main: changed since they were copied, in this or an interrupted run
+            last_task_id = task_ids[-1] if task_ids else None
+            dropped = 0
+            while True:
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute("SELECT id FROM " + ARCHIVE_SCHEMA + ".Task AS a WHERE id > ? "
+                               "AND id <= coalesce(?, id) AND EXISTS (SELECT 1 FROM main.Task WHERE id = a.id) "
+                               "ORDER BY id LIMIT ?", (after_task_id, last_task_id, MAX_IDS_PER_STATEMENT))
+                stale = [row[0] for row in cursor.fetchall()]
+                if stale:
+                    drop_from_archive(cursor, "(" + ", ".join("?" * len(stale)) + ")", stale)
+                conn.commit()
+                dropped += len(stale)
+                if len(stale) < MAX_IDS_PER_STATEMENT:
+                    break
+        if archived or dropped:
+            bump_generation("Task", "Assignment")
+        return len(archived), assignments, last_task_id
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+# tasks among the given ids (appended as "(?, ...)") still in main whose every main assignment
+# has an identical archived copy, i.e. that are safe to delete from main
+ARCHIVED_TASKS_CMD = ("SELECT Task.id FROM main.Task AS Task "
+                      "WHERE EXISTS (SELECT 1 FROM " + ARCHIVE_SCHEMA + ".Task AS a WHERE a.id = Task.id) "
+                      "AND NOT EXISTS (SELECT 1 FROM main.Assignment AS m WHERE m.task_id = Task.id "
+                      "AND NOT EXISTS (SELECT 1 FROM " + ARCHIVE_SCHEMA + ".Assignment AS a WHERE a.id = m.id "
+                      "AND a.employee_id = m.employee_id AND a.task_id = m.task_id AND a.completed = m.completed "
+                      "AND a.completed_at IS m.completed_at)) "
+                      "AND Task.id IN ")
+
+
+def copy_to_archive(cursor, marks, task_ids):
+    """
+    Copy tasks and their assignments into the archive, adding to the archived workload only the
+    assignments not archived before, so copying the same rows again changes nothing.
+    Reads main but writes only the archive.
+    :param cursor: Cursor inside a transaction
+    :param marks: String "(?, ...)" with one placeholder per task id
+    :param task_ids: List[int]
+    :return: None
+    """
+    archive = ARCHIVE_SCHEMA
+    cursor.execute("INSERT OR IGNORE INTO " + archive + ".Task "
+                   "SELECT id, customer_name, job_description, price, estimated_hours "
+                   "FROM main.Task WHERE id IN " + marks, task_ids)
+    cursor.execute("INSERT INTO " + archive + ".Employee_Workload"
+                   "(employee_id, completed_count, completed_price, completed_hours) "
+                   "SELECT m.employee_id, count(*), total(t.price), total(t.estimated_hours) "
+                   "FROM main.Assignment AS m JOIN " + archive + ".Task AS t ON t.id = m.task_id "
+                   "WHERE m.task_id IN " + marks + " "
+                   "AND NOT EXISTS (SELECT 1 FROM " + archive + ".Assignment AS a WHERE a.id = m.id) "
+                   "GROUP BY m.employee_id "
+                   "ON CONFLICT(employee_id) DO UPDATE SET "
+                   "completed_count = completed_count + excluded.completed_count, "
+                   "completed_price = completed_price + excluded.completed_price, "
+                   "completed_hours = completed_hours + excluded.completed_hours", task_ids)
+    cursor.execute("INSERT OR IGNORE INTO " + archive + ".Assignment "
+                   "SELECT id, employee_id, task_id, completed, completed_at "
+                   "FROM main.Assignment WHERE task_id IN " + marks, task_ids)
+
+
+def drop_from_archive(cursor, marks, task_ids):
+    """
+    Remove archived copies of tasks that stayed in main, e.g. reopened after they were copied,
+    subtracting their assignments from the archived workload. Writes only the archive.
+    :param cursor: Cursor inside a transaction
+    :param marks: String "(?, ...)" with one placeholder per task id
+    :param task_ids: List[int]
+    :return: None
+    """
+    archive = ARCHIVE_SCHEMA
+    cursor.execute("SELECT a.employee_id, count(*), total(t.price), total(t.estimated_hours) "
+                   "FROM " + archive + ".Assignment AS a JOIN " + archive + ".Task AS t ON t.id = a.task_id "
+                   "WHERE a.task_id IN " + marks + " GROUP BY a.employee_id", task_ids)
+    cursor.executemany("UPDATE " + archive + ".Employee_Workload SET completed_count = completed_count - ?2, "
+                       "completed_price = completed_price - ?3, completed_hours = completed_hours - ?4 "
+                       "WHERE employee_id = ?1", cursor.fetchall())
+    cursor.execute("DELETE FROM " + archive + ".Assignment WHERE task_id IN " + marks, task_ids)
+    cursor.execute("DELETE FROM " + archive + ".Task WHERE id IN " + marks, task_ids)
+
+
+def archive_completed(conn, cutoff, batch_size=ARCHIVE_BATCH):
+    """
+    Run archive_batch until no eligible task is left.
+    :param conn: Connection
+    :param cutoff: String timestamp, see cutoff_days_ago
+    :param batch_size: int
+    :return: dict with "tasks" and "assignments" moved, or the exception on failure
+    """
+    moved = {"tasks": 0, "assignments": 0}
+    last_task_id = 0
+    try:
+        attach_archive(conn)
+        while last_task_id is not None:
+            tasks, assignments, last_task_id = archive_batch(conn, cutoff, last_task_id, batch_size)
+            moved["tasks"] += tasks
+            moved["assignments"] += assignments
+        return moved
+    except Exception as e:
+        print("archive_completed(): ", e)
+        return e
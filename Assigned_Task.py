@@ -0,0 +1,61 @@
+"""
+Assigned_Task.py: Class structure for a Task together with the state of its assignments.
+Alec Shellberg
+10/18/2026
+"""
+
+from IT_Task_Manager.Task import Task
+
+
+class AssignedTask(Task):
+    # fixed attributes, no per-instance __dict__
+    __slots__ = ("__assignee_ids", "__open_count", "__completed_count")
+
+    def __init__(self, task_id, customer_name, job_desc, price, hours, assignee_ids=(), open_count=0,
+                 completed_count=0):
+        super().__init__(task_id, customer_name, job_desc, price, hours)
+        self.__assignee_ids = tuple(assignee_ids)
+        self.__open_count = open_count
+        self.__completed_count = completed_count
+
+
+    def __str__(self):
+        return (super().__str__()
+                + ",".join(str(employee_id) for employee_id in self.__assignee_ids).center(15, " ")
+                + str(self.get_completed()).center(15, " ")
+                )
+
+    # getters
+    def get_assignee_ids(self):
+        return self.__assignee_ids
+
+
+    def get_open_count(self):
+        return self.__open_count
+
+
+    def get_completed_count(self):
+        return self.__completed_count
+
+
+    def get_completed(self):
+        """
+        :return: String "yes" once the task is assigned and every assignment is complete, otherwise "no"
+        """
+        if self.__completed_count > 0 and self.__open_count == 0:
+            return "yes"
+        return "no"
+
+    # setters
+    def set_assignee_ids(self, new_ids):
+        self.__assignee_ids = tuple(new_ids)
+
+
+    def set_open_count(self, new_count):
+        if type(new_count) == int:
+            self.__open_count = new_count
+
+
+    def set_completed_count(self, new_count):
+        if type(new_count) == int:
+            self.__completed_count = new_count
@@ -5,11 +5,15 @@ Alec Shellberg
 """
 
 class Assignment:
-    def __init__(self, assignment_id, employee_id, task_id, completed):
+    # fixed attributes, no per-instance __dict__
+    __slots__ = ("__assignment_id", "__employee_id", "__task_id", "__completed", "__completed_at")
+
+    def __init__(self, assignment_id, employee_id, task_id, completed, completed_at=None):
         self.__assignment_id = assignment_id
         self.__employee_id = employee_id
         self.__task_id = task_id
         self.__completed = completed
+        self.__completed_at = completed_at
 
 
     def __str__(self):
@@ -35,6 +39,10 @@ class Assignment:
     def get_completed(self):
         return self.__completed
 
+
+    def get_completed_at(self):
+        return self.__completed_at
+
     # setters
     def set_id(self, new_id):
         if type(new_id) == int:
@@ -53,3 +61,7 @@ class Assignment:
 
     def set_completed(self, new_value):
         self.__completed = new_value
+
+
+    def set_completed_at(self, new_value):
+        self.__completed_at = new_value
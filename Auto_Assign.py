@@ -0,0 +1,107 @@
+"""
+Auto_Assign.py: Assign unassigned tasks to the technicians with the least open work.
+Alec Shellberg
+10/18/2026
+"""
+
+import heapq
+from contextlib import closing
+
+from IT_Task_Manager.Assignment import Assignment
+from IT_Task_Manager.Database_Tier import bulk_add_assignments
+
+# unassigned tasks handled per auto_assign call
+AUTO_ASSIGN_BATCH = 1000
+
+
+def open_workloads(conn, employee_ids=None):
+    """
+    Open estimated hours per technician, read from the trigger-maintained Employee_Workload summary.
+    :param conn: Connection
+    :param employee_ids: Iterable[int] technicians to consider, or None for every employee
+    :return: List[(float, int)] (open hours, employee id)
+    """
+    cmd = ("SELECT coalesce(w.open_hours, 0.0), Employee.id FROM Employee "
+           "LEFT JOIN Employee_Workload AS w ON w.employee_id = Employee.id")
+    with closing(conn.cursor()) as cursor:
+        cursor.execute(cmd)
+        workloads = cursor.fetchall()
+    if employee_ids is not None:
+        wanted = set(employee_ids)
+        workloads = [workload for workload in workloads if workload[1] in wanted]
+    return workloads
+
+
+def unassigned_tasks(conn, limit=AUTO_ASSIGN_BATCH, largest_first=False, after=None):
+    """
+    :param conn: Connection
+    :param limit: int
+    :param largest_first: bool order by estimated hours, longest first, instead of oldest first
+    :param after: (int, float) last task of the previous batch, so the scan resumes past it instead of
+        re-reading every task assigned so far, or None to start from the first task
+    :return: List[(int, float)] (task id, estimated hours)
+    """
+    cmd = ("SELECT id, estimated_hours FROM Task "
+           "WHERE NOT EXISTS (SELECT 1 FROM Assignment WHERE Assignment.task_id = Task.id)")
+    params = []
+    if after is not None and largest_first:
+        cmd += " AND (estimated_hours < ? OR (estimated_hours = ? AND id > ?))"
+        params += [after[1], after[1], after[0]]
+    elif after is not None:
+        cmd += " AND id > ?"
+        params.append(after[0])
+    cmd += " ORDER BY " + ("estimated_hours DESC, id" if largest_first else "id") + " LIMIT ?"
+    params.append(limit)
+    with closing(conn.cursor()) as cursor:
+        cursor.execute(cmd, params)
+        return cursor.fetchall()
+
+
+def plan_assignments(workloads, tasks):
+    """
+    Give each task, in order, to the technician with the fewest open hours so far.
+    A min-heap keyed on open hours makes each pick O(log technicians); ties go to the lower employee id.
+    :param workloads: Iterable[(float, int)] (open hours, employee id)
+    :param tasks: Iterable[(int, float)] (task id, estimated hours)
+    :return: List[(int, int)] (employee id, task id)
+    """
+    heap = list(workloads)
+    if not heap:
+        return []
+    heapq.heapify(heap)
+    plan = []
+    for task_id, hours in tasks:
+        open_hours, employee_id = heap[0]
+        plan.append((employee_id, task_id))
+        heapq.heapreplace(heap, (open_hours + hours, employee_id))
+    return plan
+
+
+def auto_assign(conn, batch_size=AUTO_ASSIGN_BATCH, employee_ids=None, largest_first=False, after=None):
+    """
+    Assign up to batch_size unassigned tasks. Reading the workloads and writing the new assignments
+    happen in one write transaction, so concurrent assignments cannot slip in between.
+    To work through a backlog, pass each batch's "last" back as after until it is None.
+    :param conn: Connection
+    :param batch_size: int
+    :param employee_ids: Iterable[int] technicians to assign to, or None for every employee
+    :param largest_first: bool
+    :param after: (int, float) "last" of the previous batch, or None for the first batch
+    :return: dict with "assigned" (int), "failed" ((index, row, error) tuples) and "last" (the batch's last
+        (task id, estimated hours), None when no unassigned task was left), or the exception on failure
+    """
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute("BEGIN IMMEDIATE")
+        tasks = unassigned_tasks(conn, batch_size, largest_first, after)
+        plan = plan_assignments(open_workloads(conn, employee_ids), tasks)
+        report = bulk_add_assignments(conn, (Assignment(None, employee_id, task_id, "no")
+                                             for employee_id, task_id in plan))
+        if "error" in report:
+            return report["error"]
+        return {"assigned": sum(report["chunks"]), "failed": report["failed"], "last": tasks[-1] if tasks else None}
+    except Exception as e:
+        print("auto_assign(): ", e)
+        if conn.in_transaction:
+            conn.rollback()
+        return e
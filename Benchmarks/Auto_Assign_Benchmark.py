@@ -0,0 +1,87 @@
+"""
+Auto_Assign_Benchmark.py: Time auto-assigning a backlog of unassigned tasks and report how evenly it spreads the hours.
+Alec Shellberg
+10/18/2026
+
+python -m IT_Task_Manager.Benchmarks.Auto_Assign_Benchmark --tasks 100000 --technicians 1000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from contextlib import closing
+
+from IT_Task_Manager.Auto_Assign import AUTO_ASSIGN_BATCH, open_workloads, unassigned_tasks, plan_assignments, \
+    auto_assign
+from IT_Task_Manager.Benchmarks.Synthetic_Data import generate_employees, generate_tasks, populate
+from IT_Task_Manager.Database_Tier import create_connection, init_tables, bulk_add_employees, bulk_add_tasks
+
+
+def build_database(conn, tasks, technicians, history, seed=0):
+    """
+    :param conn: Connection
+    :param tasks: int unassigned tasks to create
+    :param technicians: int
+    :param history: int tasks already assigned (with a skewed share of open work) before the backlog
+    :param seed: int
+    :return: None
+    """
+    rng = random.Random(seed)
+    init_tables(conn)
+    if history:
+        populate(conn, history, seed)
+    bulk_add_employees(conn, generate_employees(technicians - len(open_workloads(conn)), rng))
+    bulk_add_tasks(conn, generate_tasks(tasks, rng))
+
+
+def spread(conn):
+    """
+    :param conn: Connection
+    :return: dict summary of open hours per technician
+    """
+    hours = [open_hours for open_hours, _ in open_workloads(conn)]
+    return {"min_hours": min(hours), "max_hours": max(hours), "stdev_hours": statistics.pstdev(hours)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the workload-balancing auto-assignment.")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--technicians", type=int, default=1000)
+    parser.add_argument("--history", type=int, default=0, help="pre-existing skewed assignments")
+    parser.add_argument("--batch", type=int, default=AUTO_ASSIGN_BATCH, help="tasks assigned per auto_assign call")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    with closing(create_connection(":memory:")) as conn:
+        build_database(conn, args.tasks, args.technicians, args.history, args.seed)
+        print("before:", spread(conn))
+
+        start = time.perf_counter()
+        workloads = open_workloads(conn)
+        tasks = unassigned_tasks(conn, args.tasks)
+        read = time.perf_counter() - start
+        start = time.perf_counter()
+        plan_assignments(workloads, tasks)
+        planned = time.perf_counter() - start
+        print("read %d technicians and %d tasks: %.3f s, heap plan: %.3f s (%.2f us/task)"
+              % (len(workloads), len(tasks), read, planned, planned / max(1, len(tasks)) * 1e6))
+
+        assigned = 0
+        batches = 0
+        last = None
+        start = time.perf_counter()
+        while True:
+            report = auto_assign(conn, args.batch, after=last)
+            if isinstance(report, Exception) or report["last"] is None:
+                break
+            assigned += report["assigned"]
+            batches += 1
+            last = report["last"]
+        elapsed = time.perf_counter() - start
+        print("auto_assign: %d tasks in %d batches, %.3f s (%.0f tasks/s)"
+              % (assigned, batches, elapsed, assigned / elapsed))
+        print("after:", spread(conn))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Database_Benchmark.py: Times the public Database_Tier functions on synthetic data and writes a JSON report.
+Alec Shellberg
+10/18/2026
+
+python -m IT_Task_Manager.Benchmarks.Database_Benchmark --scale 100k --output before.json
+python -m IT_Task_Manager.Benchmarks.Database_Benchmark --compare before.json after.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from IT_Task_Manager.Assignment import Assignment
+from IT_Task_Manager.Benchmarks.Synthetic_Data import SCALES, employee_count_for, generate_tasks, populate
+from IT_Task_Manager.Database_Tier import create_connection, init_tables, add_task, add_assignment, \
+    bulk_add_tasks, query_employees, query_tasks, query_assignments, update_assignment_status, count_tasks, \
+    query_tasks_window, query_tasks_page, query_tasks_with_assignments, check_task_query_plans
+from IT_Task_Manager.Task import Task
+
+# a benchmark is reported as a regression when its median grows by more than this factor
+REGRESSION_THRESHOLD = 1.25
+
+
+def time_calls(fn, repeat):
+    """
+    :param fn: function of no arguments
+    :param repeat: int
+    :return: dict of call statistics
+    """
+    durations = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        durations.append(time.perf_counter() - start)
+    durations.sort()
+    stats = {"calls": repeat,
+             "median_ms": statistics.median(durations) * 1000,
+             "min_ms": durations[0] * 1000,
+             "p95_ms": durations[min(repeat - 1, int(repeat * 0.95))] * 1000}
+    if isinstance(result, list):
+        stats["rows"] = len(result)
+    return stats
+
+
+def run_benchmarks(conn, task_count, repeat, writes, seed=0):
+    """
+    Reads first, then writes, so every read sees the same populated database.
+    :param conn: Connection
+    :param task_count: int
+    :param repeat: int calls per read benchmark
+    :param writes: int calls per write benchmark
+    :param seed: int
+    :return: dict of {benchmark name: statistics}
+    """
+    rng = random.Random(seed)
+    employee_count = employee_count_for(task_count)
+    results = {}
+    results["query_employees()"] = time_calls(lambda: query_employees(conn), repeat)
+    # employee 1 owns the most work under the synthetic skew, the last employee the least
+    for is_complete in ("", "yes", "no"):
+        for employee_id in (0, 1, employee_count):
+            args = "(is_complete=%r, employee_id=%d)" % (is_complete, employee_id)
+            results["query_tasks" + args] = time_calls(lambda: query_tasks(conn, is_complete, employee_id), repeat)
+            results["query_tasks_with_assignments" + args] = time_calls(
+                lambda: query_tasks_with_assignments(conn, is_complete, employee_id), repeat)
+            results["count_tasks" + args] = time_calls(lambda: count_tasks(conn, is_complete, employee_id), repeat)
+            results["query_tasks_page" + args] = time_calls(
+                lambda: query_tasks_page(conn, is_complete, employee_id)[0], repeat)
+            middle = count_tasks(conn, is_complete, employee_id) // 2
+            results["query_tasks_window" + args] = time_calls(
+                lambda: query_tasks_window(conn, middle, 200, "price", False, is_complete, employee_id), repeat)
+    for is_completed in ("", "yes", "no"):
+        results["query_assignments(is_completed=%r)" % is_completed] = time_calls(
+            lambda: query_assignments(conn, is_completed), repeat)
+    results["add_task()"] = time_calls(
+        lambda: add_task(conn, Task(None, "Bench Customer", "Bench job", 10.0, 1.0)), writes)
+    results["add_assignment()"] = time_calls(
+        lambda: add_assignment(conn, Assignment(None, rng.randint(1, employee_count),
+                                                rng.randint(1, task_count), "no")), writes)
+    results["update_assignment_status()"] = time_calls(
+        lambda: update_assignment_status(conn, rng.choice(("yes", "no")), rng.randint(1, task_count)), writes)
+    results["bulk_add_tasks(10000)"] = time_calls(
+        lambda: bulk_add_tasks(conn, generate_tasks(10000, rng)), max(1, writes // 100))
+    return results
+
+
+def run(scale, repeat, writes, database=None):
+    """
+    :param scale: String key of SCALES
+    :param repeat: int
+    :param writes: int
+    :param database: String existing benchmark database to reuse, or None for a fresh temporary one
+    :return: dict report
+    """
+    task_count = SCALES[scale]
+    with tempfile.TemporaryDirectory() as directory:
+        path = database or os.path.join(directory, "benchmark.db")
+        conn = create_connection(path)
+        init_tables(conn)
+        start = time.perf_counter()
+        if count_tasks(conn) == 0:
+            populate(conn, task_count)
+        populate_seconds = time.perf_counter() - start
+        # employee-filtered task queries that fell back to a table scan, keyed "is_complete/employee_id"
+        plan_regressions = {"%s/%d" % key: scans for key, scans in check_task_query_plans(conn).items()}
+        results = run_benchmarks(conn, task_count, repeat, writes)
+        conn.close()
+    return {"meta": {"scale": scale,
+                     "tasks": task_count,
+                     "populate_seconds": populate_seconds,
+                     "python": platform.python_version(),
+                     "sqlite": sqlite3.sqlite_version,
+                     "platform": platform.platform()},
+            "query_plan_regressions": plan_regressions,
+            "results": results}
+
+
+def compare(base, head, threshold=REGRESSION_THRESHOLD):
+    """
+    :param base: dict report
+    :param head: dict report
+    :param threshold: float
+    :return: List[(name, base median ms, head median ms, ratio)] benchmarks slower than threshold
+    """
+    regressions = []
+    for name, stats in head["results"].items():
+        before = base["results"].get(name)
+        if before is None or before["median_ms"] == 0:
+            continue
+        ratio = stats["median_ms"] / before["median_ms"]
+        if ratio > threshold:
+            regressions.append((name, before["median_ms"], stats["median_ms"], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the help desk database tier.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--database", help="reuse (or create) this database file instead of a temporary one")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"), help="diff two JSON reports")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+    if args.compare:
+        with open(args.compare[0]) as base_file, open(args.compare[1]) as head_file:
+            regressions = compare(json.load(base_file), json.load(head_file), args.threshold)
+        for name, before, after, ratio in regressions:
+            print("%-70s %10.2f ms -> %10.2f ms (x%.2f)" % (name, before, after, ratio))
+        sys.exit(1 if regressions else 0)
+    report = run(args.scale, args.repeat, args.writes, args.database)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    for key, scans in report["query_plan_regressions"].items():
+        print("query plan regression (is_complete/employee_id %s): %s" % (key, "; ".join(scans)), file=sys.stderr)
+    sys.exit(1 if report["query_plan_regressions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
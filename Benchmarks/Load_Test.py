@@ -0,0 +1,269 @@
+"""
+Load_Test.py: Many processes acting as technicians against one database file, reporting throughput,
+latency percentiles and "database is locked" rates per operation.
+Alec Shellberg
+10/18/2026
+
+python -m IT_Task_Manager.Benchmarks.Load_Test --workers 8 --seconds 20
+python -m IT_Task_Manager.Benchmarks.Load_Test --workers 16 --mix add_task=1,update_assignment_status=4,query_tasks=5 \
+    --busy-timeout-ms 200 --isolation-level immediate --output load.json
+"""
+
+import argparse
+import io
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import closing, redirect_stdout
+
+from IT_Task_Manager.Assignment import Assignment
+from IT_Task_Manager.Benchmarks.Synthetic_Data import generate_tasks, populate
+from IT_Task_Manager.Database_Tier import BUSY_TIMEOUT_MS, create_connection, init_tables, add_task, \
+    add_assignment, update_assignment_status, query_tasks
+from IT_Task_Manager.Instrumentation import instrumentation, is_error
+
+# relative weight of each operation in a worker's random mix
+DEFAULT_MIX = {"add_task": 2, "add_assignment": 2, "update_assignment_status": 3, "query_tasks": 3}
+PERCENTILES = (50, 95, 99)
+LOCKED_MESSAGE = "database is locked"
+# seconds the harness waits for workers to connect, or to report after their run ends
+STARTUP_TIMEOUT = 60
+
+
+def parse_mix(text):
+    """
+    :param text: String "operation=weight,..." e.g. "add_task=1,query_tasks=4"
+    :return: dict {operation: float weight}
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError("unknown operation " + repr(name) + ", expected one of "
+                                             + ", ".join(sorted(DEFAULT_MIX)))
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def configure(conn, busy_timeout_ms, isolation_level, synchronous):
+    """
+    Apply the settings under test on top of Database_Tier.configure_connection.
+    :param conn: Connection
+    :param busy_timeout_ms: int how long a writer waits for the lock before "database is locked"
+    :param isolation_level: String "deferred", "immediate" or "exclusive" BEGIN issued before each write
+    :param synchronous: String PRAGMA synchronous value, or None to keep the tier's setting
+    :return: None
+    """
+    conn.isolation_level = isolation_level.upper()
+    with closing(conn.cursor()) as cursor:
+        cursor.execute("PRAGMA busy_timeout=" + str(int(busy_timeout_ms)))
+        if synchronous:
+            cursor.execute("PRAGMA synchronous=" + synchronous)
+
+
+def table_sizes(conn):
+    """
+    :param conn: Connection
+    :return: (int max task id, int max employee id, int max assignment id)
+    """
+    with closing(conn.cursor()) as cursor:
+        cursor.execute("SELECT (SELECT coalesce(max(id), 0) FROM Task), (SELECT coalesce(max(id), 0) FROM Employee), "
+                       "(SELECT coalesce(max(id), 0) FROM Assignment)")
+        return cursor.fetchone()
+
+
+def operation(name, conn, rng, sizes):
+    """
+    :param name: String key of DEFAULT_MIX
+    :param conn: Connection
+    :param rng: random.Random
+    :param sizes: (int, int, int) from table_sizes
+    :return: function of no arguments issuing one call of that operation
+    """
+    task_count, employee_count, assignment_count = sizes
+    if name == "add_task":
+        return lambda: add_task(conn, next(generate_tasks(1, rng)))
+    if name == "add_assignment":
+        return lambda: add_assignment(conn, Assignment(None, rng.randint(1, employee_count),
+                                                       rng.randint(1, task_count), rng.choice(("yes", "no"))))
+    if name == "update_assignment_status":
+        return lambda: update_assignment_status(conn, rng.choice(("yes", "no")), rng.randint(1, assignment_count))
+    return lambda: query_tasks(conn, rng.choice(("yes", "no", "")), rng.randint(1, employee_count))
+
+
+def run_worker(index, path, mix, seconds, settings, sizes, barrier, results):
+    """
+    One simulated technician: calls randomly chosen operations back to back until the time is up.
+    The tier functions print their errors and return them (or an empty result), so both the
+    return value and the captured output decide whether a call failed.
+    :param index: int worker number, also the random seed
+    :param path: String database file
+    :param mix: dict {operation: weight}
+    :param seconds: float
+    :param settings: dict keyword arguments for configure
+    :param sizes: (int, int, int) from table_sizes
+    :param barrier: multiprocessing.Barrier every worker starts together
+    :param results: multiprocessing.Queue receives (index, {operation: statistics})
+    :return: None
+    """
+    # keep the slow query log's EXPLAIN runs out of the measured latencies
+    instrumentation.slow_ms = float("inf")
+    rng = random.Random(index)
+    conn = create_connection(path)
+    configure(conn, **settings)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    calls = {name: operation(name, conn, rng, sizes) for name in names}
+    stats = {name: {"latencies_ms": [], "errors": 0, "locked": 0} for name in names}
+    output = io.StringIO()
+    barrier.wait()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        output.seek(0)
+        output.truncate()
+        start = time.perf_counter()
+        with redirect_stdout(output):
+            result = calls[name]()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        record = stats[name]
+        record["latencies_ms"].append(elapsed_ms)
+        printed = output.getvalue()
+        if printed or is_error(result):
+            record["errors"] += 1
+            record["locked"] += LOCKED_MESSAGE in printed + repr(result)
+    conn.close()
+    results.put((index, stats))
+
+
+def percentile(ordered, p):
+    """
+    Nearest-rank percentile.
+    :param ordered: List[float] sorted ascending, not empty
+    :param p: float
+    :return: float
+    """
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))]
+
+
+def summarize(worker_stats, seconds):
+    """
+    :param worker_stats: List[dict] per-worker statistics from run_worker
+    :param seconds: float measured run time
+    :return: dict {operation: summary}, with an "all" entry across operations
+    """
+    merged = {}
+    for stats in worker_stats:
+        for name, record in stats.items():
+            into = merged.setdefault(name, {"latencies_ms": [], "errors": 0, "locked": 0})
+            into["latencies_ms"].extend(record["latencies_ms"])
+            into["errors"] += record["errors"]
+            into["locked"] += record["locked"]
+    merged["all"] = {"latencies_ms": [latency for record in list(merged.values()) for latency in record["latencies_ms"]],
+                     "errors": sum(record["errors"] for record in merged.values()),
+                     "locked": sum(record["locked"] for record in merged.values())}
+    summary = {}
+    for name, record in merged.items():
+        ordered = sorted(record["latencies_ms"])
+        calls = len(ordered)
+        summary[name] = {"calls": calls,
+                         "ops_per_second": calls / seconds,
+                         "errors": record["errors"],
+                         "locked": record["locked"],
+                         "locked_rate": record["locked"] / calls if calls else 0.0}
+        for p in PERCENTILES:
+            summary[name]["p%d_ms" % p] = percentile(ordered, p) if calls else None
+    return summary
+
+
+def run(path, workers, seconds, mix, settings):
+    """
+    :param path: String migrated, populated database file
+    :param workers: int processes
+    :param seconds: float
+    :param mix: dict {operation: weight}
+    :param settings: dict keyword arguments for configure
+    :return: dict report
+    """
+    with closing(create_connection(path)) as conn:
+        sizes = table_sizes(conn)
+    barrier = multiprocessing.Barrier(workers + 1, timeout=STARTUP_TIMEOUT)
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=run_worker,
+                                         args=(index, path, mix, seconds, settings, sizes, barrier, results))
+                 for index in range(workers)]
+    for process in processes:
+        process.start()
+    barrier.wait()
+    start = time.perf_counter()
+    # drain the queue before joining, a worker blocks on exit until its results are read
+    worker_stats = [results.get(timeout=seconds + STARTUP_TIMEOUT)[1] for _ in processes]
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+    return {"meta": {"workers": workers,
+                     "seconds": elapsed,
+                     "mix": mix,
+                     "settings": settings,
+                     "python": platform.python_version(),
+                     "sqlite": sqlite3.sqlite_version,
+                     "platform": platform.platform()},
+            "results": summarize(worker_stats, elapsed)}
+
+
+def format_report(report):
+    """
+    :param report: dict from run
+    :return: String table, one row per operation
+    """
+    lines = ["operation".ljust(26) + "calls".rjust(9) + "ops/s".rjust(10) + "p50_ms".rjust(10) + "p95_ms".rjust(10)
+             + "p99_ms".rjust(10) + "errors".rjust(8) + "locked".rjust(8) + "locked%".rjust(9)]
+    results = report["results"]
+    for name in sorted(results, key=lambda name: name == "all"):
+        stats = results[name]
+        latencies = "".join(("%.2f" % stats["p%d_ms" % p] if stats["p%d_ms" % p] is not None else "-").rjust(10)
+                            for p in PERCENTILES)
+        lines.append(name.ljust(26) + str(stats["calls"]).rjust(9) + ("%.0f" % stats["ops_per_second"]).rjust(10)
+                     + latencies + str(stats["errors"]).rjust(8) + str(stats["locked"]).rjust(8)
+                     + ("%.2f" % (stats["locked_rate"] * 100)).rjust(9))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the help desk database tier with concurrent processes.")
+    parser.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 2))
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="operation weights, e.g. add_task=1,add_assignment=1,update_assignment_status=2,"
+                             "query_tasks=6")
+    parser.add_argument("--tasks", type=int, default=10000, help="synthetic tasks in a fresh database")
+    parser.add_argument("--database", help="reuse (or create) this database file instead of a temporary one")
+    parser.add_argument("--busy-timeout-ms", type=int, default=BUSY_TIMEOUT_MS)
+    parser.add_argument("--isolation-level", choices=("deferred", "immediate", "exclusive"), default="deferred")
+    parser.add_argument("--synchronous", choices=("OFF", "NORMAL", "FULL"))
+    parser.add_argument("--output", help="also write the JSON report here")
+    args = parser.parse_args()
+    settings = {"busy_timeout_ms": args.busy_timeout_ms, "isolation_level": args.isolation_level,
+                "synchronous": args.synchronous}
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.database or os.path.join(directory, "load_test.db")
+        with closing(create_connection(path)) as conn:
+            init_tables(conn)
+            if table_sizes(conn)[2] == 0:
+                populate(conn, args.tasks)
+        report = run(path, args.workers, args.seconds, args.mix, settings)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Model_Benchmark.py: Hydration speed and memory of Assignment objects, positional indexing versus row factory.
+Alec Shellberg
+10/18/2026
+"""
+
+import argparse
+import sqlite3
+import time
+import tracemalloc
+from contextlib import closing
+
+from IT_Task_Manager.Database_Tier import assignment_factory
+
+
+class DictAssignment:
+    """
+    Assignment as it was before __slots__: same attributes, stored in a per-instance __dict__.
+    """
+    def __init__(self, assignment_id, employee_id, task_id, completed, completed_at=None):
+        self.__assignment_id = assignment_id
+        self.__employee_id = employee_id
+        self.__task_id = task_id
+        self.__completed = completed
+        self.__completed_at = completed_at
+
+
+def build_table(conn, rows):
+    """
+    :param conn: Connection
+    :param rows: int
+    :return: None
+    """
+    # same columns as the migrated Assignment table: 0/1 completed flag and its completion time
+    conn.execute("CREATE TABLE Assignment(id INTEGER PRIMARY KEY, employee_id INTEGER NOT NULL,"
+                 "task_id INTEGER NOT NULL, completed INTEGER NOT NULL DEFAULT 0, completed_at TIMESTAMP)")
+    conn.executemany("INSERT INTO Assignment VALUES (?, ?, ?, ?, ?)",
+                     ((i, i % 1000, i, 1 if i % 3 else 0, "2026-10-18 12:00:00" if i % 3 else None)
+                      for i in range(1, rows + 1)))
+    conn.commit()
+
+
+def hydrate_indexed(conn):
+    """
+    The previous query_assignments loop: fetch tuples, index them, construct dict-backed objects.
+    :param conn: Connection
+    :return: list
+    """
+    with closing(conn.cursor()) as cursor:
+        cursor.execute("SELECT * FROM Assignment")
+        return [DictAssignment(row[0], row[1], row[2], "yes" if row[3] else "no", row[4]) for row in cursor.fetchall()]
+
+
+def hydrate_row_factory(conn):
+    """
+    The current query_assignments path: slotted Assignment built by the cursor's row factory.
+    :param conn: Connection
+    :return: list
+    """
+    with closing(conn.cursor()) as cursor:
+        cursor.row_factory = assignment_factory
+        cursor.execute("SELECT * FROM Assignment")
+        return cursor.fetchall()
+
+
+def measure(conn, hydrate, rows):
+    """
+    :param conn: Connection
+    :param hydrate: function
+    :param rows: int
+    :return: (objects per second, bytes per row)
+    """
+    start = time.perf_counter()
+    objects = hydrate(conn)
+    elapsed = time.perf_counter() - start
+    del objects
+    tracemalloc.start()
+    objects = hydrate(conn)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return rows / elapsed, retained / rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Assignment hydration strategies.")
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+    with closing(sqlite3.connect(":memory:")) as conn:
+        build_table(conn, args.rows)
+        print("strategy".ljust(24) + "objects/sec".rjust(14) + "bytes/row".rjust(12))
+        for name, hydrate in (("indexed + __dict__", hydrate_indexed), ("row_factory + __slots__", hydrate_row_factory)):
+            rate, size = measure(conn, hydrate, args.rows)
+            print(name.ljust(24) + ("%.0f" % rate).rjust(14) + ("%.1f" % size).rjust(12))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Startup_Benchmark.py: Measures application launch cost against databases of increasing size.
+Alec Shellberg
+10/18/2026
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from IT_Task_Manager.Benchmarks.Synthetic_Data import populate
+from IT_Task_Manager.Database_Tier import create_connection, init_tables, count_tasks, count_employees, \
+    count_assignments, query_employees_window, query_tasks_window, query_assignments_window
+
+# rows the GUI fetches for the first screen of each table
+FIRST_BLOCK = 200
+# the first screen counts as flat while the largest database's time stays within this factor of the smallest's,
+# or within FLAT_SLACK_MS of it, so sub-millisecond timings do not trip the check on noise
+FLAT_FACTOR = 3.0
+FLAT_SLACK_MS = 2.0
+
+
+def build_database(path, size):
+    """
+    Create a database with `size` tasks and assignments.
+    :param path: String
+    :param size: int
+    :return: None
+    """
+    conn = create_connection(path)
+    init_tables(conn)
+    populate(conn, size)
+    conn.close()
+
+
+def time_startup(path):
+    """
+    Time what the application does before its first screen: open, bootstrap the schema, then for each table
+    what VirtualTable.reload runs when its tab is shown: the first rows, which are drawn as soon as they arrive,
+    then the row count that sizes the scrollbar afterwards.
+    :param path: String
+    :return: dict of seconds per phase
+    """
+    timings = {}
+    start = time.perf_counter()
+    conn = create_connection(path)
+    init_tables(conn)
+    timings["schema"] = time.perf_counter() - start
+    start = time.perf_counter()
+    query_tasks_window(conn, 0, FIRST_BLOCK)
+    query_employees_window(conn, 0, FIRST_BLOCK)
+    query_assignments_window(conn, 0, FIRST_BLOCK)
+    timings["first_page"] = time.perf_counter() - start
+    start = time.perf_counter()
+    count_tasks(conn)
+    count_employees(conn)
+    count_assignments(conn, "")
+    timings["counts"] = time.perf_counter() - start
+    conn.close()
+    return timings
+
+
+def run(sizes, repeat):
+    """
+    :param sizes: list[int]
+    :param repeat: int
+    :return: dict of {size: {phase: median seconds}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, "startup_" + str(size) + ".db")
+            build_database(path, size)
+            samples = [time_startup(path) for _ in range(repeat)]
+            results[size] = {phase: statistics.median(sample[phase] for sample in samples)
+                             for phase in samples[0]}
+    return results
+
+
+def check_flat(results):
+    """
+    :param results: dict from run
+    :return: List[(int size, float ms, float smallest size's ms)] sizes whose time to first screen
+        (schema plus first page) is not flat, see FLAT_FACTOR
+    """
+    first_screen = {size: (timings["schema"] + timings["first_page"]) * 1000 for size, timings in results.items()}
+    baseline = first_screen[min(first_screen)]
+    limit = max(baseline * FLAT_FACTOR, baseline + FLAT_SLACK_MS)
+    return [(size, ms, baseline) for size, ms in sorted(first_screen.items()) if ms > limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup cost versus database size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    results = run(args.sizes, args.repeat)
+    print("rows".rjust(10) + "schema ms".rjust(12) + "first page ms".rjust(16) + "counts ms".rjust(12))
+    for size, timings in results.items():
+        print(str(size).rjust(10)
+              + ("%.2f" % (timings["schema"] * 1000)).rjust(12)
+              + ("%.2f" % (timings["first_page"] * 1000)).rjust(16)
+              + ("%.2f" % (timings["counts"] * 1000)).rjust(12))
+    growth = check_flat(results)
+    for size, ms, baseline in growth:
+        print("first screen not flat: %d rows took %.2f ms, %d rows %.2f ms" % (size, ms, min(results), baseline),
+              file=sys.stderr)
+    sys.exit(1 if growth else 0)
+
+
+if __name__ == "__main__":
+    main()
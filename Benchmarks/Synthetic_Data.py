@@ -0,0 +1,119 @@
+"""
+Synthetic_Data.py: Generators for realistic employee, task and assignment data at benchmark scale.
+Alec Shellberg
+10/18/2026
+"""
+
+import random
+from itertools import accumulate
+
+from IT_Task_Manager.Assignment import Assignment
+from IT_Task_Manager.Database_Tier import bulk_add_employees, bulk_add_tasks, bulk_add_assignments
+from IT_Task_Manager.Employee import Employee
+from IT_Task_Manager.Task import Task
+
+# named scales: number of tasks (and assignments) generated
+SCALES = {"1k": 1000, "100k": 100000, "10M": 10000000}
+# one technician per this many tasks, never fewer than MIN_EMPLOYEES
+TASKS_PER_EMPLOYEE = 1000
+MIN_EMPLOYEES = 5
+# Zipf exponent of the assignment distribution: higher means a few technicians own more of the work
+SKEW = 1.2
+# share of assignments already completed
+COMPLETED_RATIO = 0.7
+
+FIRST_NAMES = ["John", "Jenny", "Bob", "Alice", "Carl", "Dana", "Eli", "Fay", "Gus", "Hana", "Ivan", "Jade"]
+LAST_NAMES = ["Johnson", "Jenson", "Benson", "Allen", "Clark", "Drake", "Marsh", "Rivers", "Sparks", "Cole"]
+CUSTOMERS = ["Charlie Cook", "Harriet Holmes", "Jackie Jumper", "Logan Locke", "Allen Apple", "Megan Marsh",
+             "Dylan Drake", "Sophie Sparks", "Reese Rivers", "Carter Cole"]
+JOBS = ["Fix WiFi", "Setup computer", "Recover login", "Repair mouse", "Replace hardrive", "Install printer",
+        "Clean malware", "Upgrade RAM", "Optimize system", "Configure email"]
+
+
+def employee_count_for(task_count):
+    """
+    :param task_count: int
+    :return: int
+    """
+    return max(MIN_EMPLOYEES, task_count // TASKS_PER_EMPLOYEE)
+
+
+def generate_employees(count, rng):
+    """
+    :param count: int
+    :param rng: random.Random
+    :return: Generator[Employee]
+    """
+    for i in range(count):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        yield Employee(None, first, last, "555-%03d-%04d" % (i // 10000 % 1000, i % 10000),
+                       (first[0] + last + str(i)).lower() + "@helpdesk.com")
+
+
+def generate_tasks(count, rng):
+    """
+    :param count: int
+    :param rng: random.Random
+    :return: Generator[Task]
+    """
+    for _ in range(count):
+        yield Task(None, rng.choice(CUSTOMERS), rng.choice(JOBS),
+                   round(rng.uniform(20, 200), 2), round(rng.uniform(0.25, 8), 2))
+
+
+def generate_assignments(task_count, employee_count, rng, skew=SKEW, batch=10000):
+    """
+    One assignment per task. Technicians are drawn from a Zipf distribution, so employee 1
+    gets the most work and the long tail very little.
+    :param task_count: int
+    :param employee_count: int
+    :param rng: random.Random
+    :param skew: float
+    :param batch: int technicians drawn per rng.choices call
+    :return: Generator[Assignment]
+    """
+    employees = range(1, employee_count + 1)
+    cum_weights = list(accumulate(1 / rank ** skew for rank in employees))
+    task_id = 1
+    while task_id <= task_count:
+        draw = min(batch, task_count - task_id + 1)
+        for employee_id in rng.choices(employees, cum_weights=cum_weights, k=draw):
+            yield Assignment(None, employee_id, task_id, "yes" if rng.random() < COMPLETED_RATIO else "no")
+            task_id += 1
+
+
+def generate_reassignments(count, task_count, employee_count, rng, skew=SKEW):
+    """
+    Extra assignments on top of generate_assignments. Tasks are drawn from a Zipf distribution too,
+    so a few tasks collect many technicians while most keep their single assignment.
+    :param count: int
+    :param task_count: int
+    :param employee_count: int
+    :param rng: random.Random
+    :param skew: float
+    :return: Generator[Assignment]
+    """
+    task_weights = list(accumulate(1 / rank ** skew for rank in range(1, task_count + 1)))
+    employee_weights = list(accumulate(1 / rank ** skew for rank in range(1, employee_count + 1)))
+    task_ids = rng.choices(range(1, task_count + 1), cum_weights=task_weights, k=count)
+    employee_ids = rng.choices(range(1, employee_count + 1), cum_weights=employee_weights, k=count)
+    for task_id, employee_id in zip(task_ids, employee_ids):
+        yield Assignment(None, employee_id, task_id, "yes" if rng.random() < COMPLETED_RATIO else "no")
+
+
+def populate(conn, task_count, seed=0, skew=SKEW):
+    """
+    Fill an empty, migrated database with synthetic rows.
+    :param conn: Connection
+    :param task_count: int
+    :param seed: int
+    :param skew: float
+    :return: dict of row counts per table
+    """
+    rng = random.Random(seed)
+    employee_count = employee_count_for(task_count)
+    bulk_add_employees(conn, generate_employees(employee_count, rng))
+    bulk_add_tasks(conn, generate_tasks(task_count, rng))
+    bulk_add_assignments(conn, generate_assignments(task_count, employee_count, rng, skew))
+    return {"Employee": employee_count, "Task": task_count, "Assignment": task_count}
@@ -0,0 +1,101 @@
+"""
+Task_Join_Benchmark.py: Row counts and latency of the old Task-Assignment JOIN against the deduplicated task queries.
+Alec Shellberg
+10/18/2026
+
+python -m IT_Task_Manager.Benchmarks.Task_Join_Benchmark --tasks 100000 --reassignments 50000
+"""
+
+import argparse
+import random
+import sys
+from contextlib import closing
+
+from IT_Task_Manager.Benchmarks.Database_Benchmark import time_calls
+from IT_Task_Manager.Benchmarks.Synthetic_Data import employee_count_for, generate_reassignments, populate
+from IT_Task_Manager.Database_Tier import create_connection, init_tables, bulk_add_assignments, \
+    completed_condition, task_factory, fetch_rows, query_tasks, query_tasks_with_assignments
+
+
+def legacy_query_tasks(conn, is_complete="", employee_id=0):
+    """
+    query_tasks as it was: a plain JOIN, returning a task once per matching assignment.
+    :param conn: Connection
+    :param is_complete: String
+    :param employee_id: int
+    :return: List[Task]
+    """
+    if employee_id != 0 or is_complete:
+        cmd = ("SELECT Task.id, Task.customer_name, Task.job_description, Task.price, Task.estimated_hours "
+               "FROM Task JOIN Assignment ON Assignment.task_id = Task.id WHERE 1=1")
+    else:
+        cmd = "SELECT * FROM Task WHERE 1=1"
+    params = []
+    if employee_id != 0:
+        cmd += " AND Assignment.employee_id = ?"
+        params.append(employee_id)
+    if is_complete:
+        cmd += " AND " + completed_condition("Assignment.completed", is_complete)
+    return fetch_rows(conn, cmd, tuple(params), task_factory)
+
+
+def build_database(conn, task_count, reassignments, seed=0):
+    """
+    :param conn: Connection
+    :param task_count: int
+    :param reassignments: int assignments added beyond one per task
+    :param seed: int
+    :return: None
+    """
+    init_tables(conn)
+    populate(conn, task_count, seed)
+    rng = random.Random(seed + 1)
+    bulk_add_assignments(conn, generate_reassignments(reassignments, task_count, employee_count_for(task_count), rng))
+
+
+def run(conn, repeat):
+    """
+    Time each filter with the old join, the fixed query_tasks and query_tasks_with_assignments,
+    checking that all three agree on which tasks match.
+    :param conn: Connection
+    :param repeat: int
+    :return: List[dict] one result per (filter, query)
+    """
+    results = []
+    for is_complete, employee_id in (("", 0), ("yes", 0), ("no", 0), ("", 1), ("no", 1)):
+        legacy = legacy_query_tasks(conn, is_complete, employee_id)
+        expected = sorted({task.get_id() for task in legacy})
+        for name, fn in (("join", legacy_query_tasks), ("query_tasks", query_tasks),
+                         ("with_assignments", query_tasks_with_assignments)):
+            tasks = fn(conn, is_complete, employee_id)
+            ids = [task.get_id() for task in tasks]
+            stats = time_calls(lambda: fn(conn, is_complete, employee_id), repeat)
+            stats.update({"filter": (is_complete or "all") + "/employee " + str(employee_id), "query": name,
+                          "duplicates": len(ids) - len(set(ids)),
+                          "matches": sorted(set(ids)) == expected})
+            results.append(stats)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the Task-Assignment JOIN with the deduplicated task queries.")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--reassignments", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    with closing(create_connection(":memory:")) as conn:
+        build_database(conn, args.tasks, args.reassignments, args.seed)
+        results = run(conn, args.repeat)
+    print("filter".ljust(20) + "query".ljust(18) + "rows".rjust(10) + "duplicates".rjust(12)
+          + "median_ms".rjust(12) + "  same tasks")
+    for stats in results:
+        print(stats["filter"].ljust(20) + stats["query"].ljust(18) + str(stats["rows"]).rjust(10)
+              + str(stats["duplicates"]).rjust(12) + ("%.2f" % stats["median_ms"]).rjust(12)
+              + "  " + str(stats["matches"]))
+    if not all(stats["matches"] for stats in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
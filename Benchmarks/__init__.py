@@ -0,0 +1,4 @@
+"""
+Benchmarks: Timing scripts for the help desk database tier.
+Run each module with python -m IT_Task_Manager.Benchmarks.<module>.
+"""
@@ -0,0 +1,50 @@
+"""
+Change_Monitor.py: Detects which tables other connections or processes have written to.
+Alec Shellberg
+10/18/2026
+"""
+
+from contextlib import closing
+
+from IT_Task_Manager.Database_Tier import bump_generation
+
+
+class ChangeMonitor:
+    """
+    Poll with the same connection every time. PRAGMA data_version only changes when another
+    connection commits, so an idle poll is a single pragma; the trigger-maintained Table_Changes
+    counters are read only after a commit elsewhere, to tell which tables it touched.
+    Changed tables get their write generation bumped, so query caches and the employee directory
+    in this process drop what they hold for them.
+    """
+    def __init__(self):
+        self.__data_version = None
+        self.__changes = None
+
+
+    def poll(self, conn):
+        """
+        :param conn: Connection
+        :return: set of String table names changed since the previous poll, empty on the first poll
+        """
+        try:
+            with closing(conn.cursor()) as cursor:
+                cursor.execute("PRAGMA data_version")
+                data_version = cursor.fetchone()[0]
+                if data_version == self.__data_version:
+                    return set()
+                cursor.execute("SELECT table_name, changes FROM Table_Changes")
+                changes = dict(cursor.fetchall())
+        except Exception as e:
+            print("poll(): ", e)
+            return set()
+        self.__data_version = data_version
+        previous = self.__changes
+        self.__changes = changes
+        if previous is None:
+            return set()
+        # writes made through conn itself also show up here, the next time another connection commits
+        changed = {table for table, count in changes.items() if previous.get(table) != count}
+        if changed:
+            bump_generation(*changed)
+        return changed
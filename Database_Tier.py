@@ -4,69 +4,441 @@ Alec Shellberg
 11/29/2025
 """
 
+import re
 import sqlite3
+import threading
 from contextlib import closing
+from itertools import islice
 
+from IT_Task_Manager.Assigned_Task import AssignedTask
 from IT_Task_Manager.Assignment import Assignment
 from IT_Task_Manager.Employee import Employee
+from IT_Task_Manager.Instrumentation import instrumented
 from IT_Task_Manager.Task import Task
-from IT_Task_Manager.config import default_employee_list, default_task_list, default_assignments_list
+from IT_Task_Manager.config import database_path, default_employee_list, default_task_list, \
+    default_assignments_list
 
+# milliseconds a connection waits on a locked database before raising "database is locked"
+BUSY_TIMEOUT_MS = 5000
+# page cache per connection in KiB (negative cache_size is interpreted as KiB by sqlite)
+CACHE_SIZE_KIB = 20000
+# rows per executemany() call in the bulk_add_* functions
+BULK_CHUNK_SIZE = 5000
+# stored values of Assignment.completed for the "yes"/"no" statuses used by the models and the GUI
+COMPLETED_FLAGS = {"no": 0, "yes": 1}
+# ids per UPDATE ... IN (...) statement, leaving one parameter free below SQLite's historical 999 limit
+MAX_IDS_PER_STATEMENT = 998
+# most ids parse_id_ranges accepts, so a mistyped range cannot allocate millions of ints
+MAX_PARSED_IDS = 100000
+# rows per page for the keyset-paginated query_*_page / iter_* functions
+PAGE_SIZE = 500
+# columns the *_window functions may sort by
+EMPLOYEE_SORT_COLUMNS = ("id", "first_name", "last_name", "phone_number", "email_address")
+TASK_SORT_COLUMNS = ("id", "customer_name", "job_description", "price", "estimated_hours")
+ASSIGNMENT_SORT_COLUMNS = ("id", "employee_id", "task_id", "completed")
 
-def create_connection():
+# maximum rows returned by search_tasks
+SEARCH_LIMIT = 100
+
+# name the archive database is attached under, see Archive.attach_archive
+ARCHIVE_SCHEMA = "archive"
+# shadows Task and Assignment with the hot rows plus the archived ones for the statement it prefixes;
+# archived tasks are not in Task_fts, so a text filter only matches hot tasks
+ARCHIVE_UNION = ("WITH Task AS ("
+                 "SELECT id, customer_name, job_description, price, estimated_hours FROM main.Task UNION ALL "
+                 "SELECT id, customer_name, job_description, price, estimated_hours FROM " + ARCHIVE_SCHEMA + ".Task), "
+                 "Assignment AS ("
+                 "SELECT id, employee_id, task_id, completed, completed_at FROM main.Assignment UNION ALL "
+                 "SELECT id, employee_id, task_id, completed, completed_at FROM " + ARCHIVE_SCHEMA + ".Assignment) ")
+
+# per-table write counters, bumped by the write paths in this process so caches can tell they are stale
+table_generations = {"Employee": 0, "Task": 0, "Assignment": 0}
+generation_lock = threading.Lock()
+
+
+def bump_generation(*tables):
+    """
+    :param tables: String table names written to
+    :return: None
+    """
+    with generation_lock:
+        for table in tables:
+            table_generations[table] += 1
+
+
+def table_generation(table):
+    """
+    :param table: String
+    :return: int
+    """
+    return table_generations[table]
+
+
+# number of statements interrupted through interrupt_connection, so caches can drop their truncated results
+interrupt_count = 0
+
+
+def interrupt_connection(conn):
+    """
+    Abort the statement running on conn; the interrupted call returns an empty result.
+    :param conn: Connection
+    :return: None
+    """
+    global interrupt_count
+    with generation_lock:
+        interrupt_count += 1
+    conn.interrupt()
+
+
+def interrupt_generation():
+    """
+    :return: int
+    """
+    return interrupt_count
+
+
+# reads that failed and returned an empty result instead, e.g. "database is locked"; caches must not keep those
+read_failure_count = 0
+
+
+def record_read_failure():
+    """
+    :return: None
+    """
+    global read_failure_count
+    with generation_lock:
+        read_failure_count += 1
+
+
+def read_failure_generation():
+    """
+    :return: int
+    """
+    return read_failure_count
+
+
+class Connection(sqlite3.Connection):
+    """
+    sqlite3.Connection that can be weakly referenced, so per-connection state kept elsewhere,
+    such as the query cache's last seen data_version, goes away with the connection.
+    """
+
+
+def create_connection(path=database_path, check_same_thread=True):
     """
     Create connection to database.
+    :param path: String database file, Help_Desk.db (or $HELP_DESK_DB) by default
+    :param check_same_thread: bool, False for a connection handed from one thread to another
     :return: Connection or None
     """
     try:
-        conn = sqlite3.connect("Help_Desk.db")
+        conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=check_same_thread,
+                               factory=Connection)
+        configure_connection(conn)
         return conn
     except Exception as e:
         print("create_connection(): ",e)
         return None
 
 
+def configure_connection(conn):
+    """
+    WAL lets readers run alongside the writer; synchronous=NORMAL is durable under WAL except
+    for the last transactions on power loss, and avoids an fsync per commit.
+    :param conn: Connection
+    :return: None
+    """
+    with closing(conn.cursor()) as cursor:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA busy_timeout=" + str(BUSY_TIMEOUT_MS))
+        cursor.execute("PRAGMA cache_size=-" + str(CACHE_SIZE_KIB))
+
+
+@instrumented()
 def init_tables(conn):
     """
-    Initialize employee, task, and assignment tables in Help_Desk.db.
+    Initialize employee, task, and assignment tables in Help_Desk.db by applying any pending
+    schema migrations. A no-op on an up-to-date database; demo rows are only added by seed_demo_data.
     :param conn: Connection
     :return: String
     """
-    emp_table_cmd = ("CREATE TABLE IF NOT EXISTS "
-                     "Employee(id INTEGER PRIMARY KEY AUTOINCREMENT,"
-                     "first_name VARCHAR(30) NOT NULL,"
-                     "last_name VARCHAR(40) NOT NULL,"
-                     "phone_number VARCHAR(20) NOT NULL,"
-                     "email_address VARCHAR(100) NOT NULL)")
-    task_table_cmd = ("CREATE TABLE IF NOT EXISTS "
-                      "Task(id INTEGER PRIMARY KEY AUTOINCREMENT,"
-                      "customer_name VARCHAR(60) NOT NULL,"
-                      "job_description VARCHAR(100) NOT NULL,"
-                      "price REAL NOT NULL,"
-                      "estimated_hours REAL NOT NULL)")
-    assignment_table_cmd = ("CREATE TABLE IF NOT EXISTS "
-                            "Assignment(id INTEGER PRIMARY KEY AUTOINCREMENT,"
-                            "employee_id INTEGER NOT NULL,"
-                            "task_id INTEGER NOT NULL,"
-                            "completed VARCHAR(5) NOT NULL,"
-                            "FOREIGN KEY(employee_id) REFERENCES Employee(id),"
-                            "FOREIGN KEY(task_id) REFERENCES Task(id))")
     try:
-        with closing(conn.cursor()) as cursor:
-            cursor.execute(emp_table_cmd)
-            cursor.execute(task_table_cmd)
-            cursor.execute(assignment_table_cmd)
-            populate_default_entries(conn)
-        return "Tables successfully created."
+        applied = migrate_schema(conn)
+        if applied:
+            return "Applied schema migrations " + ", ".join(str(version) for version in applied) + "."
+        return "Schema up to date."
     except Exception as e:
         print("init_tables(): ", e)
         return e
 
 
+def migrate_schema(conn):
+    """
+    Apply every migration in MIGRATIONS newer than the version recorded in schema_version,
+    each in its own transaction.
+    :param conn: Connection
+    :return: List[int] versions applied
+    """
+    applied = []
+    with closing(conn.cursor()) as cursor:
+        cursor.execute("CREATE TABLE IF NOT EXISTS schema_version(version INTEGER NOT NULL)")
+        cursor.execute("SELECT coalesce(max(version), 0) FROM schema_version")
+        current = cursor.fetchone()[0]
+        for version, migration in MIGRATIONS:
+            if version <= current:
+                continue
+            try:
+                cursor.execute("BEGIN")
+                migration(cursor)
+                cursor.execute("INSERT INTO schema_version(version) VALUES (?)", (version,))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            applied.append(version)
+    if applied:
+        bump_generation(*table_generations)
+    return applied
+
+
+def create_base_tables(cursor):
+    """
+    Schema migration 1: Employee, Task and Assignment tables.
+    :param cursor: Cursor
+    :return: None
+    """
+    cursor.execute("CREATE TABLE IF NOT EXISTS "
+                   "Employee(id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                   "first_name VARCHAR(30) NOT NULL,"
+                   "last_name VARCHAR(40) NOT NULL,"
+                   "phone_number VARCHAR(20) NOT NULL,"
+                   "email_address VARCHAR(100) NOT NULL)")
+    cursor.execute("CREATE TABLE IF NOT EXISTS "
+                   "Task(id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                   "customer_name VARCHAR(60) NOT NULL,"
+                   "job_description VARCHAR(100) NOT NULL,"
+                   "price REAL NOT NULL,"
+                   "estimated_hours REAL NOT NULL)")
+    cursor.execute("CREATE TABLE IF NOT EXISTS "
+                   "Assignment(id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                   "employee_id INTEGER NOT NULL,"
+                   "task_id INTEGER NOT NULL,"
+                   "completed VARCHAR(5) NOT NULL,"
+                   "FOREIGN KEY(employee_id) REFERENCES Employee(id),"
+                   "FOREIGN KEY(task_id) REFERENCES Task(id))")
+
+
+def create_indexes(cursor):
+    """
+    Schema migration 2: secondary indexes used by the filtered task and assignment queries.
+    :param cursor: Cursor
+    :return: None
+    """
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignment_employee_completed "
+                   "ON Assignment(employee_id, completed)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignment_task "
+                   "ON Assignment(task_id)")
+
+
+def convert_completed_to_flag(cursor):
+    """
+    Schema migration 3: store Assignment.completed as a 0/1 INTEGER instead of "yes"/"no" text,
+    record completed_at, and add a partial index covering only open assignments.
+    SQLite cannot change a column type in place, so the table is rebuilt. Rows already completed
+    get the migration time as completed_at since the real time was never recorded.
+    :param cursor: Cursor
+    :return: None
+    """
+    cursor.execute("CREATE TABLE Assignment_new("
+                   "id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                   "employee_id INTEGER NOT NULL,"
+                   "task_id INTEGER NOT NULL,"
+                   "completed INTEGER NOT NULL DEFAULT 0 CHECK (completed IN (0, 1)),"
+                   "completed_at TIMESTAMP,"
+                   "FOREIGN KEY(employee_id) REFERENCES Employee(id),"
+                   "FOREIGN KEY(task_id) REFERENCES Task(id))")
+    cursor.execute("INSERT INTO Assignment_new(id, employee_id, task_id, completed, completed_at) "
+                   "SELECT id, employee_id, task_id, lower(completed) = 'yes', "
+                   "CASE WHEN lower(completed) = 'yes' THEN CURRENT_TIMESTAMP END FROM Assignment")
+    cursor.execute("DROP TABLE Assignment")
+    cursor.execute("ALTER TABLE Assignment_new RENAME TO Assignment")
+    create_indexes(cursor)
+    cursor.execute("CREATE INDEX idx_assignment_open ON Assignment(task_id) WHERE completed = 0")
+
+
+def create_employee_name_indexes(cursor):
+    """
+    Schema migration 4: case-insensitive name indexes for prefix search. LIKE is case-insensitive,
+    so SQLite only turns "name LIKE 'ab%'" into an index range scan on a NOCASE index.
+    :param cursor: Cursor
+    :return: None
+    """
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_employee_first_name ON Employee(first_name COLLATE NOCASE)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_employee_last_name ON Employee(last_name COLLATE NOCASE)")
+
+
+def create_task_search_index(cursor):
+    """
+    Schema migration 5: FTS5 index over Task.customer_name and Task.job_description.
+    It is an external-content table reading its text from Task, kept in sync by triggers.
+    :param cursor: Cursor
+    :return: None
+    """
+    cursor.execute("CREATE VIRTUAL TABLE Task_fts USING fts5("
+                   "customer_name, job_description, content='Task', content_rowid='id')")
+    cursor.execute("CREATE TRIGGER task_fts_insert AFTER INSERT ON Task BEGIN "
+                   "INSERT INTO Task_fts(rowid, customer_name, job_description) "
+                   "VALUES (new.id, new.customer_name, new.job_description); END")
+    cursor.execute("CREATE TRIGGER task_fts_delete AFTER DELETE ON Task BEGIN "
+                   "INSERT INTO Task_fts(Task_fts, rowid, customer_name, job_description) "
+                   "VALUES ('delete', old.id, old.customer_name, old.job_description); END")
+    cursor.execute("CREATE TRIGGER task_fts_update AFTER UPDATE OF customer_name, job_description ON Task BEGIN "
+                   "INSERT INTO Task_fts(Task_fts, rowid, customer_name, job_description) "
+                   "VALUES ('delete', old.id, old.customer_name, old.job_description); "
+                   "INSERT INTO Task_fts(rowid, customer_name, job_description) "
+                   "VALUES (new.id, new.customer_name, new.job_description); END")
+    cursor.execute("INSERT INTO Task_fts(Task_fts) VALUES ('rebuild')")
+
+
+def create_workload_summary(cursor):
+    """
+    Schema migration 6: Employee_Workload keeps per-technician open/completed counts, price and hours
+    up to date through triggers on Assignment and Task, so reports read one row per employee
+    instead of aggregating the whole assignment history.
+    :param cursor: Cursor
+    :return: None
+    """
+    cursor.execute("CREATE TABLE Employee_Workload("
+                   "employee_id INTEGER PRIMARY KEY,"
+                   "open_count INTEGER NOT NULL DEFAULT 0,"
+                   "completed_count INTEGER NOT NULL DEFAULT 0,"
+                   "open_price REAL NOT NULL DEFAULT 0,"
+                   "completed_price REAL NOT NULL DEFAULT 0,"
+                   "open_hours REAL NOT NULL DEFAULT 0,"
+                   "completed_hours REAL NOT NULL DEFAULT 0,"
+                   "FOREIGN KEY(employee_id) REFERENCES Employee(id))")
+    cursor.execute("CREATE TRIGGER workload_assignment_insert AFTER INSERT ON Assignment BEGIN "
+                   "INSERT OR IGNORE INTO Employee_Workload(employee_id) VALUES (new.employee_id); "
+                   + workload_delta("new", "+") + " END")
+    cursor.execute("CREATE TRIGGER workload_assignment_delete AFTER DELETE ON Assignment BEGIN "
+                   + workload_delta("old", "-") + " END")
+    cursor.execute("CREATE TRIGGER workload_assignment_update "
+                   "AFTER UPDATE OF employee_id, task_id, completed ON Assignment BEGIN "
+                   + workload_delta("old", "-") +
+                   " INSERT OR IGNORE INTO Employee_Workload(employee_id) VALUES (new.employee_id); "
+                   + workload_delta("new", "+") + " END")
+    cursor.execute("CREATE TRIGGER workload_task_update AFTER UPDATE OF price, estimated_hours ON Task BEGIN "
+                   "UPDATE Employee_Workload SET "
+                   "open_price = open_price + (new.price - old.price) * (SELECT count(*) FROM Assignment "
+                   "WHERE task_id = new.id AND employee_id = Employee_Workload.employee_id AND completed = 0), "
+                   "completed_price = completed_price + (new.price - old.price) * (SELECT count(*) FROM Assignment "
+                   "WHERE task_id = new.id AND employee_id = Employee_Workload.employee_id AND completed = 1), "
+                   "open_hours = open_hours + (new.estimated_hours - old.estimated_hours) * (SELECT count(*) "
+                   "FROM Assignment WHERE task_id = new.id AND employee_id = Employee_Workload.employee_id "
+                   "AND completed = 0), "
+                   "completed_hours = completed_hours + (new.estimated_hours - old.estimated_hours) * (SELECT count(*) "
+                   "FROM Assignment WHERE task_id = new.id AND employee_id = Employee_Workload.employee_id "
+                   "AND completed = 1) "
+                   "WHERE employee_id IN (SELECT employee_id FROM Assignment WHERE task_id = new.id); END")
+    cursor.execute("INSERT INTO Employee_Workload " + WORKLOAD_AGGREGATE_CMD)
+
+
+# per-employee totals aggregated from the full assignment history, in Employee_Workload column order
+WORKLOAD_AGGREGATE_CMD = ("SELECT Assignment.employee_id AS employee_id, "
+                          "sum(Assignment.completed = 0) AS open_count, "
+                          "sum(Assignment.completed = 1) AS completed_count, "
+                          "total(CASE WHEN Assignment.completed = 0 THEN Task.price END) AS open_price, "
+                          "total(CASE WHEN Assignment.completed = 1 THEN Task.price END) AS completed_price, "
+                          "total(CASE WHEN Assignment.completed = 0 THEN Task.estimated_hours END) AS open_hours, "
+                          "total(CASE WHEN Assignment.completed = 1 THEN Task.estimated_hours END) AS completed_hours "
+                          "FROM Assignment JOIN Task ON Task.id = Assignment.task_id "
+                          "GROUP BY Assignment.employee_id")
+
+
+def workload_delta(row, sign):
+    """
+    Trigger statement adding (sign "+") or removing (sign "-") one assignment row's share of
+    Employee_Workload.
+    :param row: String "new" or "old"
+    :param sign: String "+" or "-"
+    :return: String
+    """
+    task = "(SELECT {0} FROM Task WHERE id = " + row + ".task_id)"
+    return ("UPDATE Employee_Workload SET "
+            "open_count = open_count {s} ({r}.completed = 0), "
+            "completed_count = completed_count {s} ({r}.completed = 1), "
+            "open_price = open_price {s} ({r}.completed = 0) * {price}, "
+            "completed_price = completed_price {s} ({r}.completed = 1) * {price}, "
+            "open_hours = open_hours {s} ({r}.completed = 0) * {hours}, "
+            "completed_hours = completed_hours {s} ({r}.completed = 1) * {hours} "
+            "WHERE employee_id = {r}.employee_id;").format(s=sign, r=row, price=task.format("price"),
+                                                           hours=task.format("estimated_hours"))
+
+
+def create_change_counters(cursor):
+    """
+    Schema migration 7: Table_Changes counts the rows written to each table, by any connection,
+    so a process can tell which tables another one changed without querying them.
+    :param cursor: Cursor
+    :return: None
+    """
+    cursor.execute("CREATE TABLE Table_Changes("
+                   "table_name TEXT PRIMARY KEY,"
+                   "changes INTEGER NOT NULL DEFAULT 0) WITHOUT ROWID")
+    for table in table_generations:
+        cursor.execute("INSERT INTO Table_Changes(table_name) VALUES (?)", (table,))
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute("CREATE TRIGGER changes_" + table.lower() + "_" + event.lower() + " AFTER " + event
+                           + " ON " + table + " BEGIN UPDATE Table_Changes SET changes = changes + 1 "
+                           "WHERE table_name = '" + table + "'; END")
+
+
+def create_sort_indexes(cursor):
+    """
+    Schema migration 8: indexes on the Task and Assignment columns the windowed views sort by, so
+    "ORDER BY column, id" walks an index (which ends in the rowid) instead of sorting the table per block.
+    Employee is small, and Assignment's employee_id and task_id already lead an index. Assignment.completed
+    gets none: with two values it is a poor index, and the planner would pick it over idx_assignment_task
+    for the correlated "task has a completed assignment" filters.
+    :param cursor: Cursor
+    :return: None
+    """
+    for column in TASK_SORT_COLUMNS[1:]:
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_task_" + column + " ON Task(" + column + ")")
+
+
+def create_open_assignment_index(cursor):
+    """
+    Schema migration 9: partial index on the ids of open assignments, so the Assignments tab's
+    "Incomplete" view pages and counts through the few open rows rather than the whole history.
+    idx_assignment_open leads with task_id and so cannot serve "ORDER BY id".
+    :param cursor: Cursor
+    :return: None
+    """
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignment_open_id ON Assignment(id) WHERE completed = 0")
+
+
+# ordered (version, migration) pairs applied by migrate_schema; append new steps, never edit old ones
+MIGRATIONS = [
+    (1, create_base_tables),
+    (2, create_indexes),
+    (3, convert_completed_to_flag),
+    (4, create_employee_name_indexes),
+    (5, create_task_search_index),
+    (6, create_workload_summary),
+    (7, create_change_counters),
+    (8, create_sort_indexes),
+    (9, create_open_assignment_index),
+]
+
+
+@instrumented()
 def add_employee(conn, employee):
     """
     :param conn: Connection
-    :param employee: Employee
+    :param employee: Employee, given its new id on success
     :return: String
     """
     cmd = "INSERT INTO Employee(first_name, last_name, phone_number, email_address) VALUES (?, ?, ?, ?)"
@@ -77,16 +449,20 @@ def add_employee(conn, employee):
                            employee.get_phone(),
                            employee.get_email()))
             conn.commit()
+            employee.set_id(cursor.lastrowid)
+        bump_generation("Employee")
         return "Successfully added employee."
     except Exception as e:
         print("add_employee(): ", e)
+        conn.rollback()
         return e
 
 
+@instrumented()
 def add_task(conn, task):
     """
     :param conn: Connection
-    :param task: Task
+    :param task: Task, given its new id on success
     :return: String
     """
     cmd = "INSERT INTO Task(customer_name, job_description, price, estimated_hours) VALUES (?, ?, ?, ?)"
@@ -97,80 +473,320 @@ def add_task(conn, task):
                            task.get_price(),
                            task.get_hours()))
             conn.commit()
+            task.set_id(cursor.lastrowid)
+        bump_generation("Task")
         return "Successfully added task."
     except Exception as e:
         print("add_task(): ", e)
+        conn.rollback()
         return e
 
 
+# completed_at defaults to the insert time for assignments created already completed
+ASSIGNMENT_INSERT_CMD = ("INSERT INTO Assignment(employee_id, task_id, completed, completed_at) "
+                         "VALUES (?, ?, ?, CASE WHEN ? = 1 THEN coalesce(?, CURRENT_TIMESTAMP) END)")
+
+
+def assignment_params(assignment):
+    """
+    :param assignment: Assignment
+    :return: tuple parameters for ASSIGNMENT_INSERT_CMD
+    """
+    flag = completed_flag(assignment.get_completed())
+    return assignment.get_employee_id(), assignment.get_task_id(), flag, flag, assignment.get_completed_at()
+
+
+def completed_flag(status):
+    """
+    :param status: String "yes" or "no"
+    :return: int stored value of Assignment.completed
+    """
+    try:
+        return COMPLETED_FLAGS[status.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError("Completed status must be 'yes' or 'no', not " + repr(status))
+
+
+def completed_condition(column, status):
+    """
+    SQL condition on the completed flag. The flag is inlined as a literal rather than bound,
+    since SQLite only uses the partial index on open assignments when it can see "completed = 0".
+    :param column: String
+    :param status: String "yes" or "no"
+    :return: String
+    """
+    return column + " = " + str(completed_flag(status))
+
+
+@instrumented()
 def add_assignment(conn, assignment):
     """
     :param conn: Connection
-    :param assignment: Assignment
+    :param assignment: Assignment, given its new id on success
     :return: String
     """
-    cmd = "INSERT INTO Assignment(employee_id, task_id, completed) VALUES (?, ?, ?)"
+    cmd = ASSIGNMENT_INSERT_CMD
     try:
         with closing(conn.cursor()) as cursor:
-            cursor.execute(cmd, (assignment.get_employee_id(),
-                           assignment.get_task_id(),
-                           assignment.get_completed()))
+            cursor.execute(cmd, assignment_params(assignment))
             conn.commit()
+            assignment.set_id(cursor.lastrowid)
+        bump_generation("Assignment")
         return "Successfully added assignment."
     except Exception as e:
         print("add_assignment(): ", e)
+        conn.rollback()
         return e
 
 
 
+@instrumented()
 def reset_tables(conn):
     """
-    Drop Employee, Task, and Assignments tables.
+    Drop Employee, Task, and Assignments tables along with the schema version.
     :param conn: Connection
     :return: String
     """
     del_emp = "DROP TABLE IF EXISTS Employee"
     del_task = "DROP TABLE IF EXISTS Task"
     del_assignment = "DROP TABLE IF EXISTS Assignment"
+    del_version = "DROP TABLE IF EXISTS schema_version"
+    del_task_fts = "DROP TABLE IF EXISTS Task_fts"
+    del_workload = "DROP TABLE IF EXISTS Employee_Workload"
+    del_changes = "DROP TABLE IF EXISTS Table_Changes"
     try:
         with closing(conn.cursor()) as cursor:
+            cursor.execute(del_workload)
+            cursor.execute(del_changes)
+            cursor.execute(del_assignment)
             cursor.execute(del_emp)
             cursor.execute(del_task)
-            cursor.execute(del_assignment)
+            cursor.execute(del_task_fts)
+            cursor.execute(del_version)
+        bump_generation(*table_generations)
         return "Tables successfully dropped."
     except Exception as e:
         print("reset_tables(): ", e)
         return e
 
 
+@instrumented(trace=False)
+def bulk_add_employees(conn, employees, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Insert many employees in a single transaction.
+    :param conn: Connection
+    :param employees: Iterable[Employee]
+    :param chunk_size: int
+    :return: dict
+    """
+    cmd = "INSERT INTO Employee(first_name, last_name, phone_number, email_address) VALUES (?, ?, ?, ?)"
+    params = ((employee.get_first_name(),
+               employee.get_last_name(),
+               employee.get_phone(),
+               employee.get_email()) for employee in employees)
+    report = bulk_insert(conn, cmd, params, chunk_size)
+    bump_generation("Employee")
+    return report
+
+
+@instrumented(trace=False)
+def bulk_add_tasks(conn, tasks, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Insert many tasks in a single transaction.
+    :param conn: Connection
+    :param tasks: Iterable[Task]
+    :param chunk_size: int
+    :return: dict
+    """
+    cmd = "INSERT INTO Task(customer_name, job_description, price, estimated_hours) VALUES (?, ?, ?, ?)"
+    params = ((task.get_customer_name(),
+               task.get_description(),
+               task.get_price(),
+               task.get_hours()) for task in tasks)
+    report = bulk_insert(conn, cmd, params, chunk_size)
+    bump_generation("Task")
+    return report
+
+
+@instrumented(trace=False)
+def bulk_add_assignments(conn, assignments, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Insert many assignments in a single transaction.
+    :param conn: Connection
+    :param assignments: Iterable[Assignment]
+    :param chunk_size: int
+    :return: dict
+    """
+    params = (assignment_params(assignment) for assignment in assignments)
+    report = bulk_insert(conn, ASSIGNMENT_INSERT_CMD, params, chunk_size)
+    bump_generation("Assignment")
+    return report
+
+
+def bulk_insert(conn, cmd, rows, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Run an INSERT for every parameter tuple in rows with executemany, chunk by chunk,
+    inside one transaction. A chunk that fails is rolled back to its savepoint and
+    retried row-by-row so only the offending rows are skipped.
+    :param conn: Connection
+    :param cmd: String
+    :param rows: Iterable[tuple]
+    :param chunk_size: int
+    :return: dict with "chunks" (rows inserted per chunk) and "failed" ((row index, row, error) tuples)
+    """
+    report = {"chunks": [], "failed": []}
+    rows = iter(rows)
+    offset = 0
+    try:
+        with closing(conn.cursor()) as cursor:
+            if not conn.in_transaction:
+                cursor.execute("BEGIN")
+            chunk = list(islice(rows, chunk_size))
+            while chunk:
+                cursor.execute("SAVEPOINT bulk_chunk")
+                try:
+                    cursor.executemany(cmd, chunk)
+                    inserted = len(chunk)
+                except sqlite3.Error:
+                    cursor.execute("ROLLBACK TO bulk_chunk")
+                    inserted = 0
+                    for index, row in enumerate(chunk, offset):
+                        try:
+                            cursor.execute(cmd, row)
+                            inserted += 1
+                        except sqlite3.Error as e:
+                            report["failed"].append((index, row, e))
+                cursor.execute("RELEASE bulk_chunk")
+                report["chunks"].append(inserted)
+                offset += len(chunk)
+                chunk = list(islice(rows, chunk_size))
+            conn.commit()
+    except Exception as e:
+        print("bulk_insert(): ", e)
+        conn.rollback()
+        report["error"] = e
+    return report
+
+
+@instrumented(trace=False)
+def seed_demo_data(conn):
+    """
+    Opt-in: fill an empty database with the demo rows from config.py.
+    :param conn: Connection
+    :return: String
+    """
+    if count_employees(conn) or count_tasks(conn) or count_assignments(conn, ""):
+        return "Demo data can only be added to an empty database."
+    populate_default_entries(conn)
+    return "Demo data added."
+
+
 def populate_default_entries(conn):
     """
     Fill database tables with default employees, tasks and assignments from config.py
     :param conn: Connection
     :return: None
     """
-    for employee in default_employee_list:
-        add_employee(conn, employee)
-    for task in default_task_list:
-        add_task(conn, task)
-    for assignment in default_assignments_list:
-        add_assignment(conn, assignment)
+    bulk_add_employees(conn, default_employee_list)
+    bulk_add_tasks(conn, default_task_list)
+    bulk_add_assignments(conn, default_assignments_list)
+
+
+def employee_factory(cursor, row):
+    """
+    sqlite3 row factory for SELECT * FROM Employee.
+    :param cursor: Cursor
+    :param row: tuple
+    :return: Employee
+    """
+    return Employee(*row)
+
+
+def task_factory(cursor, row):
+    """
+    sqlite3 row factory for Task rows (id, customer_name, job_description, price, estimated_hours).
+    :param cursor: Cursor
+    :param row: tuple
+    :return: Task
+    """
+    return Task(*row)
+
+
+def assigned_task_factory(cursor, row):
+    """
+    sqlite3 row factory for task rows followed by the aggregated assignee id list and open/completed counts.
+    :param cursor: Cursor
+    :param row: tuple
+    :return: AssignedTask
+    """
+    assignee_ids = [int(employee_id) for employee_id in row[5].split(",")] if row[5] else ()
+    return AssignedTask(row[0], row[1], row[2], row[3], row[4], assignee_ids, row[6], row[7])
+
+
+def assignment_factory(cursor, row):
+    """
+    sqlite3 row factory for SELECT * FROM Assignment, mapping the stored 0/1 flag back to "yes"/"no".
+    :param cursor: Cursor
+    :param row: tuple
+    :return: Assignment
+    """
+    return Assignment(row[0], row[1], row[2], "yes" if row[3] else "no", row[4])
 
 
+@instrumented()
 def query_employees(conn):
     cmd = "SELECT * FROM Employee WHERE 1=1"
     employees = []
     try:
         with closing(conn.cursor()) as cursor:
+            cursor.row_factory = employee_factory
             cursor.execute(cmd)
-            rows = cursor.fetchall()
-            for row in rows:
-                employees.append(Employee(row[0], row[1], row[2], row[3], row[4]))
+            employees = cursor.fetchall()
     except Exception as e:
         print(e)
+        record_read_failure()
     return employees
 
 
+@instrumented()
+def search_employees(conn, prefix, limit=50):
+    """
+    Type-ahead lookup: employees whose first or last name starts with prefix, ignoring case.
+    "jen jo" matches first name "Jen..." with last name "Jo...". Served by the NOCASE name indexes.
+    :param conn: Connection
+    :param prefix: String
+    :param limit: int
+    :return: List[(int, String, String)] id, first name, last name
+    """
+    words = prefix.split()
+    cmd = "SELECT id, first_name, last_name FROM Employee"
+    params = ()
+    if len(words) == 1:
+        cmd += " WHERE first_name LIKE ? ESCAPE '\\' OR last_name LIKE ? ESCAPE '\\'"
+        params = (like_prefix(words[0]), like_prefix(words[0]))
+    elif words:
+        cmd += " WHERE first_name LIKE ? ESCAPE '\\' AND last_name LIKE ? ESCAPE '\\'"
+        params = (like_prefix(words[0]), like_prefix(" ".join(words[1:])))
+    cmd += " ORDER BY first_name, last_name LIMIT ?"
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute(cmd, params + (limit,))
+            return cursor.fetchall()
+    except Exception as e:
+        print("search_employees(): ", e)
+        record_read_failure()
+        return []
+
+
+def like_prefix(text):
+    """
+    :param text: String
+    :return: String LIKE pattern matching values starting with text, using \\ as the escape character
+    """
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+@instrumented()
 def retrieve_employee_names(conn):
     employee_names = ["Any"]
     cmd = "SELECT first_name, last_name FROM Employee"
@@ -182,10 +798,12 @@ def retrieve_employee_names(conn):
                 employee_names.append(row[0] + " " + row[1])
     except Exception as e:
         print("retrieve_employee_names(): ", e)
+        record_read_failure()
     return employee_names
 
 
-def query_tasks(conn, is_complete="", employee_id=0):
+@instrumented()
+def query_tasks(conn, is_complete="", employee_id=0, include_archive=False):
     """
     Retrieve tasks:
     - all
@@ -194,80 +812,639 @@ def query_tasks(conn, is_complete="", employee_id=0):
     :param conn: Connection
     :param is_complete: String
     :param employee_id: int
+    :param include_archive: bool also read the attached archive
     :return: List[Task]
     """
     tasks = []
     cmd, params = prepare_task_cmd(is_complete, employee_id)
+    cmd = archive_union(include_archive) + cmd
     try:
         with closing(conn.cursor()) as cursor:
-            if params:
-                cursor.execute(cmd, params)
-            else:
-                cursor.execute(cmd)
-            rows = cursor.fetchall()
-            for row in rows:
-                tasks.append(Task(row[0], row[1], row[2], row[3], row[4]))
+            cursor.row_factory = task_factory
+            cursor.execute(cmd, params)
+            tasks = cursor.fetchall()
     except Exception as e:
         print("query_tasks(): ", e)
+        record_read_failure()
     return tasks
 
 
 def prepare_task_cmd(is_complete, employee_id):
     """
-    Structure Task table sql query based on user input.
+    Structure Task table sql query based on user input. Assignment filters are subqueries,
+    so a task with several matching assignments is still returned once.
     :param is_complete: String
     :param employee_id: int
-    :return: List[Task]
+    :return: (String, tuple)
+    """
+    cmd = """
+    SELECT Task.id, Task.customer_name, Task.job_description, Task.price, Task.estimated_hours
+    FROM Task
+    WHERE 1=1
+    """
+    where, params = task_filter_clause(is_complete, employee_id)
+    return cmd + where, params
+
+
+@instrumented()
+def query_tasks_with_assignments(conn, is_complete="", employee_id=0, text="", include_archive=False):
+    """
+    Retrieve tasks filtered like query_tasks, each once, with its assignees and completion state
+    aggregated from all of its assignments in the same query.
+    :param conn: Connection
+    :param is_complete: String
+    :param employee_id: int
+    :param text: String
+    :param include_archive: bool also read the attached archive
+    :return: List[AssignedTask]
+    """
+    cmd, params = prepare_assigned_task_cmd(is_complete, employee_id, text)
+    return fetch_rows(conn, archive_union(include_archive) + cmd, params, assigned_task_factory)
+
+
+def prepare_assigned_task_cmd(is_complete, employee_id, text=""):
+    """
+    Filters pick the tasks through subqueries; the LEFT JOIN then brings in every assignment of
+    those tasks, found through idx_assignment_task, and GROUP BY Task.id folds them into one row.
+    :param is_complete: String
+    :param employee_id: int
+    :param text: String
+    :return: (String, tuple)
+    """
+    cmd = """
+    SELECT Task.id, Task.customer_name, Task.job_description, Task.price, Task.estimated_hours,
+           group_concat(DISTINCT Assignment.employee_id),
+           coalesce(sum(Assignment.completed = 0), 0), coalesce(sum(Assignment.completed = 1), 0)
+    FROM Task
+    LEFT JOIN Assignment ON Assignment.task_id = Task.id
+    WHERE 1=1
+    """
+    where, params = task_filter_clause(is_complete, employee_id, text)
+    return cmd + where + " GROUP BY Task.id ORDER BY Task.id", params
+
+
+def explain_query_plan(conn, cmd, params=()):
+    """
+    :param conn: Connection
+    :param cmd: String
+    :param params: tuple
+    :return: List[String] plan details
+    """
+    with closing(conn.cursor()) as cursor:
+        cursor.execute("EXPLAIN QUERY PLAN " + cmd, params)
+        return [row[3] for row in cursor.fetchall()]
+
+
+def find_table_scans(conn, cmd, params=()):
+    """
+    Plan steps that read a whole table (or a whole index) instead of seeking.
+    :param conn: Connection
+    :param cmd: String
+    :param params: tuple
+    :return: List[String]
+    """
+    return [detail for detail in explain_query_plan(conn, cmd, params) if detail.startswith("SCAN")]
+
+
+def check_task_query_plans(conn):
+    """
+    Regression check for the indexed task filters: any employee-filtered task query must
+    seek Assignment through an index and look Task up by id.
+    The unfiltered and status-only queries are excluded since they read most of the table anyway.
+    :param conn: Connection
+    :return: dict of {(is_complete, employee_id): List[String]} for queries that regressed to a scan
+    """
+    regressions = {}
+    for is_complete in ("", "yes", "no"):
+        cmd, params = prepare_task_cmd(is_complete, 1)
+        scans = find_table_scans(conn, cmd, params)
+        page_cmd, page_params = prepare_task_page_cmd(is_complete, 1)
+        scans += find_table_scans(conn, page_cmd, (0,) + page_params + (PAGE_SIZE,))
+        assigned_cmd, assigned_params = prepare_assigned_task_cmd(is_complete, 1)
+        scans += find_table_scans(conn, assigned_cmd, assigned_params)
+        if scans:
+            regressions[(is_complete, 1)] = scans
+    return regressions
+
+
+@instrumented()
+def query_assignments(conn, is_completed, include_archive=False):
+    assignments = []
+    cmd = archive_union(include_archive) + "SELECT * FROM Assignment WHERE 1=1"
+    if is_completed:
+        cmd += " AND " + completed_condition("completed", is_completed)
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.row_factory = assignment_factory
+            cursor.execute(cmd)
+            assignments = cursor.fetchall()
+    except Exception as e:
+        print("query_assignments(): ", e)
+        record_read_failure()
+    return assignments
+
+
+@instrumented()
+def query_employees_page(conn, page_token=None, page_size=PAGE_SIZE):
+    """
+    Retrieve one page of employees ordered by id.
+    :param conn: Connection
+    :param page_token: int id of the last employee on the previous page, None for the first page
+    :param page_size: int
+    :return: (List[Employee], page_token for the next page or None when exhausted)
+    """
+    cmd = "SELECT * FROM Employee WHERE id > ? ORDER BY id LIMIT ?"
+    return fetch_page(conn, cmd, (page_token or 0, page_size), page_size,
+                      employee_factory)
+
+
+@instrumented()
+def query_tasks_page(conn, is_complete="", employee_id=0, page_token=None, page_size=PAGE_SIZE):
+    """
+    Retrieve one page of tasks ordered by id, filtered like query_tasks.
+    Each task is returned once even when it has several matching assignments.
+    :param conn: Connection
+    :param is_complete: String
+    :param employee_id: int
+    :param page_token: int id of the last task on the previous page, None for the first page
+    :param page_size: int
+    :return: (List[Task], page_token for the next page or None when exhausted)
+    """
+    cmd, params = prepare_task_page_cmd(is_complete, employee_id)
+    return fetch_page(conn, cmd, (page_token or 0,) + params + (page_size,), page_size,
+                      task_factory)
+
+
+def prepare_task_page_cmd(is_complete, employee_id):
     """
-    if employee_id != 0 or is_complete:
-        cmd = """
-        SELECT Task.id, Task.customer_name, Task.job_description, Task.price, Task.estimated_hours
-        From Task
-        JOIN Assignment ON Assignment.task_id = Task.id
-        WHERE 1=1
-        """
-    else:
-        cmd = "SELECT * FROM Task"
+    Keyset-paginated Task query. Assignment filters go through a subquery rather than a JOIN
+    so Task.id stays unique and can be used as the page key.
+    :param is_complete: String
+    :param employee_id: int
+    :return: (String, tuple) parameters exclude the leading page key and trailing limit
+    """
+    cmd = """
+    SELECT Task.id, Task.customer_name, Task.job_description, Task.price, Task.estimated_hours
+    FROM Task
+    WHERE Task.id > ?
+    """
+    where, params = task_filter_clause(is_complete, employee_id)
+    cmd += where + " ORDER BY Task.id LIMIT ?"
+    return cmd, params
+
+
+def task_filter_clause(is_complete, employee_id, text=""):
+    """
+    WHERE-clause fragment restricting Task rows by their assignments, without duplicating tasks.
+    An employee filter is selective, so its task ids are collected through the
+    (employee_id, completed) index, as are open tasks through the partial index on open assignments;
+    completed tasks make up most of the history, so walking Task by id with a correlated EXISTS stops sooner.
+    :param is_complete: String
+    :param employee_id: int
+    :param text: String words that must all start a word of the customer name or job description
+    :return: (String, tuple) fragment starting with " AND", or "" when unfiltered
+    """
+    cmd = ""
     params = []
+    # text without any word characters, e.g. "-" or "#", is no filter, like blank text
+    query = fts_query(text)
+    if query:
+        cmd += " AND Task.id IN (SELECT rowid FROM Task_fts WHERE Task_fts MATCH ?)"
+        params.append(query)
     if employee_id != 0:
-        cmd += " AND Assignment.employee_id = ?"
+        cmd += " AND Task.id IN (SELECT task_id FROM Assignment WHERE employee_id = ?"
         params.append(employee_id)
-    if is_complete:
-        cmd += " AND Assignment.completed LIKE ?"
-        params.append(is_complete)
+        if is_complete:
+            cmd += " AND " + completed_condition("completed", is_complete)
+        cmd += ")"
+    elif is_complete and completed_flag(is_complete) == 0:
+        cmd += " AND Task.id IN (SELECT task_id FROM Assignment WHERE completed = 0)"
+    elif is_complete:
+        cmd += (" AND EXISTS (SELECT 1 FROM Assignment WHERE Assignment.task_id = Task.id AND "
+                + completed_condition("Assignment.completed", is_complete) + ")")
     return cmd, tuple(params)
 
 
-def query_assignments(conn, is_completed):
-    assignments = []
-    cmd = "SELECT * FROM Assignment WHERE 1=1"
+def fts_query(text):
+    """
+    Turn free text into an FTS5 query matching every word as a prefix. Words are quoted,
+    so FTS5 operators typed by the user are searched for literally.
+    :param text: String
+    :return: String
+    """
+    return " ".join('"' + word + '"*' for word in re.findall(r"\w+", text))
+
+
+@instrumented()
+def search_tasks(conn, text, is_complete="", employee_id=0, limit=SEARCH_LIMIT):
+    """
+    Full-text search over customer names and job descriptions, best matches first,
+    combinable with the query_tasks filters.
+    :param conn: Connection
+    :param text: String
+    :param is_complete: String
+    :param employee_id: int
+    :param limit: int
+    :return: List[Task]
+    """
+    query = fts_query(text)
+    if not query:
+        return []
+    where, params = task_filter_clause(is_complete, employee_id)
+    cmd = ("SELECT Task.id, Task.customer_name, Task.job_description, Task.price, Task.estimated_hours "
+           "FROM Task_fts JOIN Task ON Task.id = Task_fts.rowid "
+           "WHERE Task_fts MATCH ?" + where + " ORDER BY Task_fts.rank LIMIT ?")
+    return fetch_rows(conn, cmd, (query,) + params + (limit,), task_factory)
+
+
+@instrumented()
+def query_assignments_page(conn, is_completed, page_token=None, page_size=PAGE_SIZE):
+    """
+    Retrieve one page of assignments ordered by id, filtered like query_assignments.
+    :param conn: Connection
+    :param is_completed: String
+    :param page_token: int id of the last assignment on the previous page, None for the first page
+    :param page_size: int
+    :return: (List[Assignment], page_token for the next page or None when exhausted)
+    """
+    cmd = "SELECT * FROM Assignment WHERE id > ?"
+    params = [page_token or 0]
     if is_completed:
-        cmd += " AND completed = ?"
+        cmd += " AND " + completed_condition("completed", is_completed)
+    cmd += " ORDER BY id LIMIT ?"
+    params.append(page_size)
+    return fetch_page(conn, cmd, tuple(params), page_size,
+                      assignment_factory)
+
+
+def fetch_page(conn, cmd, params, page_size, row_factory):
+    """
+    Execute a keyset page query and hydrate its rows.
+    :param conn: Connection
+    :param cmd: String
+    :param params: tuple
+    :param page_size: int
+    :param row_factory: sqlite3 row factory building a model object
+    :return: (List[Object], int or None)
+    """
     try:
         with closing(conn.cursor()) as cursor:
-            if is_completed:
-                cursor.execute(cmd, (is_completed,))
-            else:
-                cursor.execute(cmd)
-            rows = cursor.fetchall()
-            for row in rows:
-                assignments.append(Assignment(row[0], row[1], row[2], row[3]))
+            cursor.row_factory = row_factory
+            cursor.execute(cmd, params)
+            items = cursor.fetchall()
     except Exception as e:
-        print("query_assignments(): ", e)
-    return assignments
+        print("fetch_page(): ", e)
+        record_read_failure()
+        return [], None
+    next_token = items[-1].get_id() if len(items) == page_size else None
+    return items, next_token
+
+
+def iter_employees(conn, page_size=PAGE_SIZE):
+    """
+    Stream all employees, one page in memory at a time.
+    :param conn: Connection
+    :param page_size: int
+    :return: Generator[Employee]
+    """
+    return iter_pages(lambda token: query_employees_page(conn, token, page_size))
+
+
+def iter_tasks(conn, is_complete="", employee_id=0, page_size=PAGE_SIZE):
+    """
+    Stream tasks matching the query_tasks filters, one page in memory at a time.
+    :param conn: Connection
+    :param is_complete: String
+    :param employee_id: int
+    :param page_size: int
+    :return: Generator[Task]
+    """
+    return iter_pages(lambda token: query_tasks_page(conn, is_complete, employee_id, token, page_size))
 
 
+def iter_assignments(conn, is_completed, page_size=PAGE_SIZE):
+    """
+    Stream assignments matching the query_assignments filter, one page in memory at a time.
+    :param conn: Connection
+    :param is_completed: String
+    :param page_size: int
+    :return: Generator[Assignment]
+    """
+    return iter_pages(lambda token: query_assignments_page(conn, is_completed, token, page_size))
+
+
+def iter_pages(fetch):
+    """
+    :param fetch: function taking a page_token and returning (items, next page_token)
+    :return: Generator[Object]
+    """
+    token = None
+    while True:
+        items, token = fetch(token)
+        yield from items
+        if token is None:
+            return
+
+
+@instrumented()
+def count_employees(conn):
+    """
+    :param conn: Connection
+    :return: int
+    """
+    return fetch_count(conn, "SELECT count(*) FROM Employee", ())
+
+
+@instrumented()
+def count_tasks(conn, is_complete="", employee_id=0, text="", include_archive=False):
+    """
+    :param conn: Connection
+    :param is_complete: String
+    :param employee_id: int
+    :param text: String full-text filter, see search_tasks
+    :param include_archive: bool also count the attached archive
+    :return: int number of distinct tasks matching the query_tasks filters
+    """
+    where, params = task_filter_clause(is_complete, employee_id, text)
+    return fetch_count(conn, archive_union(include_archive) + "SELECT count(*) FROM Task WHERE 1=1" + where, params)
+
+
+@instrumented()
+def count_assignments(conn, is_completed, include_archive=False):
+    """
+    :param conn: Connection
+    :param is_completed: String
+    :param include_archive: bool also count the attached archive
+    :return: int
+    """
+    cmd = archive_union(include_archive) + "SELECT count(*) FROM Assignment"
+    if is_completed and completed_flag(is_completed) == 0:
+        # without ANALYZE statistics a bare count(*) scans the smallest full index, even with a partial
+        # index on the open rows; ordering by id makes it walk idx_assignment_open_id instead
+        return fetch_count(conn, archive_union(include_archive) + "SELECT count(*) FROM "
+                           "(SELECT id FROM Assignment WHERE completed = 0 ORDER BY id)", ())
+    if is_completed:
+        return fetch_count(conn, cmd + " WHERE " + completed_condition("completed", is_completed), ())
+    return fetch_count(conn, cmd, ())
+
+
+def fetch_count(conn, cmd, params):
+    """
+    :param conn: Connection
+    :param cmd: String
+    :param params: tuple
+    :return: int
+    """
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute(cmd, params)
+            return cursor.fetchone()[0]
+    except Exception as e:
+        print("fetch_count(): ", e)
+        record_read_failure()
+        return 0
+
+
+@instrumented()
+def query_employees_window(conn, offset, limit, order_by="id", descending=False, after=None):
+    """
+    Retrieve the slice of employees visible in a scrolled view, sorted by the database.
+    :param conn: Connection
+    :param offset: int rows to skip, counted from after when it is given
+    :param limit: int
+    :param order_by: String one of EMPLOYEE_SORT_COLUMNS
+    :param descending: bool
+    :param after: (sort value, int id) of a row before the window, see seek_clause, or None
+    :return: List[Employee]
+    """
+    order = order_clause(EMPLOYEE_SORT_COLUMNS, order_by, descending)
+    seek, seek_params = seek_clause(order_by, descending, after)
+    cmd = "SELECT * FROM Employee WHERE 1=1" + seek + order
+    return fetch_rows(conn, cmd, seek_params + (limit, offset),
+                        employee_factory)
+
+
+@instrumented()
+def query_tasks_window(conn, offset, limit, order_by="id", descending=False, is_complete="", employee_id=0,
+                       text="", include_archive=False, after=None):
+    """
+    Retrieve the slice of tasks visible in a scrolled view, filtered like query_tasks and sorted by the database.
+    :param conn: Connection
+    :param offset: int rows to skip, counted from after when it is given
+    :param limit: int
+    :param order_by: String one of TASK_SORT_COLUMNS
+    :param descending: bool
+    :param is_complete: String
+    :param employee_id: int
+    :param text: String full-text filter, see search_tasks
+    :param include_archive: bool also read the attached archive
+    :param after: (sort value, int id) of a row before the window, see seek_clause, or None
+    :return: List[Task]
+    """
+    order = order_clause(TASK_SORT_COLUMNS, order_by, descending)
+    seek, seek_params = seek_clause(order_by, descending, after)
+    where, params = task_filter_clause(is_complete, employee_id, text)
+    cmd = (archive_union(include_archive) + "SELECT Task.id, Task.customer_name, Task.job_description, Task.price, Task.estimated_hours "
+           "FROM Task WHERE 1=1" + seek + where + order)
+    return fetch_rows(conn, cmd, seek_params + params + (limit, offset),
+                        task_factory)
+
+
+@instrumented()
+def query_assignments_window(conn, offset, limit, order_by="id", descending=False, is_completed="",
+                             include_archive=False, after=None):
+    """
+    Retrieve the slice of assignments visible in a scrolled view, filtered like query_assignments
+    and sorted by the database.
+    :param conn: Connection
+    :param offset: int rows to skip, counted from after when it is given
+    :param limit: int
+    :param order_by: String one of ASSIGNMENT_SORT_COLUMNS
+    :param descending: bool
+    :param is_completed: String
+    :param include_archive: bool also read the attached archive
+    :param after: (sort value, int id) of a row before the window, see seek_clause, or None;
+        a completed value is given as "yes"/"no" like the models
+    :return: List[Assignment]
+    """
+    order = order_clause(ASSIGNMENT_SORT_COLUMNS, order_by, descending)
+    if after is not None and order_by == "completed":
+        after = (completed_flag(after[0]), after[1])
+    seek, params = seek_clause(order_by, descending, after)
+    cmd = archive_union(include_archive) + "SELECT * FROM Assignment WHERE 1=1" + seek
+    if is_completed:
+        cmd += " AND " + completed_condition("completed", is_completed)
+    cmd += order
+    return fetch_rows(conn, cmd, params + (limit, offset),
+                        assignment_factory)
+
+
+def archive_union(include_archive):
+    """
+    :param include_archive: bool
+    :return: String WITH clause to put in front of a Task/Assignment query, or "" for the hot tables only
+    """
+    return ARCHIVE_UNION if include_archive else ""
+
+
+def order_clause(columns, order_by, descending):
+    """
+    ORDER BY/LIMIT/OFFSET suffix for the *_window queries. id breaks ties so every offset is stable.
+    :param columns: tuple[str] allowed sort columns
+    :param order_by: String
+    :param descending: bool
+    :return: String
+    """
+    if order_by not in columns:
+        raise ValueError("Cannot sort by " + str(order_by))
+    direction = " DESC" if descending else ""
+    order = order_by + direction
+    if order_by != "id":
+        order += ", id" + direction
+    return " ORDER BY " + order + " LIMIT ? OFFSET ?"
+
+
+def seek_clause(order_by, descending, after):
+    """
+    Keyset condition starting a *_window query just past a row already seen, e.g. the last row of the
+    previous block, so the database seeks there through the sort column's index instead of stepping
+    over every row before the offset. order_by must already be checked by order_clause.
+    :param order_by: String
+    :param descending: bool
+    :param after: (sort value, int id) of that row, or None to start from the first row
+    :return: (String fragment starting with " AND", or "", tuple)
+    """
+    if after is None:
+        return "", ()
+    comparison = " < " if descending else " > "
+    if order_by == "id":
+        return " AND id" + comparison + "?", (after[1],)
+    return " AND (" + order_by + ", id)" + comparison + "(?, ?)", tuple(after)
+
+
+def fetch_rows(conn, cmd, params, row_factory):
+    """
+    :param conn: Connection
+    :param cmd: String
+    :param params: tuple
+    :param row_factory: sqlite3 row factory building a model object
+    :return: List[Object]
+    """
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.row_factory = row_factory
+            cursor.execute(cmd, params)
+            return cursor.fetchall()
+    except Exception as e:
+        print("fetch_rows(): ", e)
+        record_read_failure()
+        return []
+
+
+@instrumented()
+def get_task(conn, task_id):
+    """
+    :param conn: Connection
+    :param task_id: int
+    :return: Task or None
+    """
+    rows = fetch_rows(conn, "SELECT * FROM Task WHERE id = ?", (task_id,),
+                      task_factory)
+    return rows[0] if rows else None
+
+
+@instrumented()
+def get_assignment(conn, assignment_id):
+    """
+    :param conn: Connection
+    :param assignment_id: int
+    :return: Assignment or None
+    """
+    rows = fetch_rows(conn, "SELECT * FROM Assignment WHERE id = ?", (assignment_id,),
+                      assignment_factory)
+    return rows[0] if rows else None
+
+
+@instrumented()
 def update_assignment_status(conn, new_status, assignment_id):
     cmd = """
     UPDATE Assignment
-    SET completed = ?
-    WHERE id = ?
+    SET completed = ?1,
+        completed_at = CASE WHEN ?1 = 1 THEN coalesce(completed_at, CURRENT_TIMESTAMP) END
+    WHERE id = ?2
+    RETURNING id
     """
     try:
         with closing(conn.cursor()) as cursor:
-            cursor.execute(cmd, (new_status, assignment_id))
+            cursor.execute(cmd, (completed_flag(new_status), assignment_id))
+            updated = cursor.fetchall()
             conn.commit()
+        bump_generation("Assignment")
+        if not updated:
+            return "No assignment with id " + str(assignment_id) + "."
         return "Completed status update successfully."
     except Exception as e:
         print("update_assignment_status(): ", e)
+        conn.rollback()
         return "Error: ", e
+
+
+@instrumented()
+def bulk_update_assignment_status(conn, new_status, assignment_ids):
+    """
+    Set the completed status of many assignments in a single transaction.
+    :param conn: Connection
+    :param new_status: String
+    :param assignment_ids: Iterable[int]
+    :return: int number of assignments whose status actually changed, or the exception on failure
+    """
+    ids = iter(assignment_ids)
+    changed = 0
+    try:
+        flag = completed_flag(new_status)
+        with closing(conn.cursor()) as cursor:
+            chunk = list(islice(ids, MAX_IDS_PER_STATEMENT))
+            while chunk:
+                # the flag is bound once as ?1, the ids take ?2 onwards
+                cmd = ("UPDATE Assignment SET completed = ?1, "
+                       "completed_at = CASE WHEN completed = 0 THEN CURRENT_TIMESTAMP END "
+                       "WHERE completed != ?1 AND id IN (" + ", ".join("?" * len(chunk)) + ")")
+                cursor.execute(cmd, [flag] + chunk)
+                changed += cursor.rowcount
+                chunk = list(islice(ids, MAX_IDS_PER_STATEMENT))
+            conn.commit()
+        if changed:
+            bump_generation("Assignment")
+        return changed
+    except Exception as e:
+        print("bulk_update_assignment_status(): ", e)
+        conn.rollback()
+        return e
+
+
+def parse_id_ranges(text):
+    """
+    Parse user input such as "12-40, 55" into ids.
+    :param text: String comma separated ids and inclusive first-last ranges
+    :return: List[int] at most MAX_PARSED_IDS ids
+    """
+    ids = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, separator, last = part.partition("-")
+        if separator:
+            first, last = int(first), int(last)
+            if first > last:
+                raise ValueError("Invalid id range: " + part)
+            if len(ids) + last - first + 1 > MAX_PARSED_IDS:
+                raise ValueError("More than " + str(MAX_PARSED_IDS) + " ids given.")
+            ids.extend(range(first, last + 1))
+        else:
+            if len(ids) >= MAX_PARSED_IDS:
+                raise ValueError("More than " + str(MAX_PARSED_IDS) + " ids given.")
+            ids.append(int(part))
+    if not ids:
+        raise ValueError("No ids given.")
+    return ids
@@ -0,0 +1,82 @@
+"""
+Database_Worker.py: Background thread that runs database calls off the Tk main thread.
+Alec Shellberg
+10/18/2026
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+
+from IT_Task_Manager.Database_Tier import create_connection, interrupt_connection
+
+
+class DatabaseWorker(threading.Thread):
+    """
+    Single thread that owns its own sqlite connection and runs submitted jobs in order.
+    Jobs are functions taking the connection as their first argument.
+    """
+    def __init__(self, connect=create_connection):
+        super().__init__(name="DatabaseWorker", daemon=True)
+        self.__connect = connect
+        self.__jobs = queue.Queue()
+        self.__conn = None
+        self.__lock = threading.Lock()
+        self.__running = None
+        self.start()
+
+
+    def run(self):
+        self.__conn = self.__connect()
+        while True:
+            job = self.__jobs.get()
+            if job is None:
+                break
+            future, fn, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self.__lock:
+                self.__running = future
+            try:
+                result = fn(self.__conn, *args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            finally:
+                with self.__lock:
+                    self.__running = None
+        if self.__conn is not None:
+            self.__conn.close()
+
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Queue fn(conn, *args, **kwargs) on the worker thread.
+        :param fn: function
+        :return: Future
+        """
+        future = Future()
+        self.__jobs.put((future, fn, args, kwargs))
+        return future
+
+
+    def cancel(self, future):
+        """
+        Cancel a queued job, or interrupt the SQL of the job currently running.
+        :param future: Future
+        :return: None
+        """
+        if future.cancel():
+            return
+        with self.__lock:
+            if self.__running is future:
+                interrupt_connection(self.__conn)
+
+
+    def stop(self):
+        """
+        Finish queued jobs, then close the connection and end the thread.
+        :return: None
+        """
+        self.__jobs.put(None)
@@ -5,6 +5,9 @@ Alec Shellberg
 """
 
 class Employee:
+    # fixed attributes, no per-instance __dict__
+    __slots__ = ("__employee_id", "__first_name", "__last_name", "__phone", "__email")
+
     def __init__(self, employee_id, first_name, last_name, phone, email):
         self.__employee_id = employee_id
         self.__first_name = first_name
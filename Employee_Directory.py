@@ -0,0 +1,92 @@
+"""
+Employee_Directory.py: Cached id <-> display name lookup for picking employees in the GUI.
+Alec Shellberg
+10/18/2026
+"""
+
+from contextlib import closing
+
+from IT_Task_Manager.Database_Tier import search_employees, table_generation
+
+
+def display_name(employee_id, first_name, last_name):
+    """
+    Names are not unique, so the id is part of what the user picks.
+    :param employee_id: int
+    :param first_name: String
+    :param last_name: String
+    :return: String
+    """
+    return first_name + " " + last_name + " (#" + str(employee_id) + ")"
+
+
+class EmployeeDirectory:
+    """
+    All employees keyed both ways, reloaded only after the Employee table has been written to.
+    """
+    ANY = "Any"
+
+    def __init__(self):
+        self.__generation = None
+        self.__names_by_id = {}
+        self.__ids_by_name = {}
+        self.__names = [self.ANY]
+
+
+    def refresh(self, conn):
+        """
+        Reload from the database if employees were added or removed since the last load.
+        :param conn: Connection
+        :return: list[str] display names, "Any" first
+        """
+        generation = table_generation("Employee")
+        if generation != self.__generation:
+            with closing(conn.cursor()) as cursor:
+                cursor.execute("SELECT id, first_name, last_name FROM Employee ORDER BY first_name, last_name")
+                rows = cursor.fetchall()
+            names_by_id = {row[0]: display_name(*row) for row in rows}
+            self.__ids_by_name = {name: employee_id for employee_id, name in names_by_id.items()}
+            self.__names_by_id = names_by_id
+            self.__names = [self.ANY] + list(names_by_id.values())
+            self.__generation = generation
+        return self.__names
+
+
+    def search(self, conn, prefix, limit=50):
+        """
+        :param conn: Connection
+        :param prefix: String
+        :param limit: int
+        :return: list[str] display names of employees whose first or last name starts with prefix
+        """
+        names = []
+        for row in search_employees(conn, prefix, limit):
+            name = display_name(*row)
+            self.__ids_by_name.setdefault(name, row[0])
+            names.append(name)
+        return names
+
+
+    def names(self):
+        """
+        :return: list[str]
+        """
+        return self.__names
+
+
+    def employee_id(self, name):
+        """
+        :param name: String display name
+        :return: int, 0 for "Any", None for an unknown name
+        """
+        if name == self.ANY:
+            return 0
+        return self.__ids_by_name.get(name)
+
+
+    def name_of(self, employee_id):
+        """
+        :param employee_id: int
+        :return: String or None
+        """
+        return self.__names_by_id.get(employee_id)
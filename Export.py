@@ -0,0 +1,116 @@
+"""
+Export.py: Streaming CSV/JSONL export of employees, tasks and assignments.
+Alec Shellberg
+10/18/2026
+"""
+
+import csv
+import gzip
+import json
+from contextlib import closing
+
+from IT_Task_Manager.Database_Tier import task_filter_clause, completed_condition
+
+# rows pulled from the cursor per fetchmany call
+EXPORT_CHUNK_SIZE = 5000
+
+EMPLOYEE_FIELDS = ("id", "first_name", "last_name", "phone_number", "email_address")
+TASK_FIELDS = ("id", "customer_name", "job_description", "price", "estimated_hours")
+ASSIGNMENT_FIELDS = ("id", "employee_id", "task_id", "completed", "completed_at")
+
+
+def open_export(path, compress=None):
+    """
+    :param path: String
+    :param compress: bool gzip the output, or None to gzip when path ends in .gz
+    :return: text file object
+    """
+    if compress is None:
+        compress = path.endswith(".gz")
+    if compress:
+        return gzip.open(path, "wt", newline="", encoding="utf-8")
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+def export_employees(conn, stream, fmt="csv", chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    :param conn: Connection
+    :param stream: text file object
+    :param fmt: String "csv" or "jsonl"
+    :param chunk_size: int
+    :return: int rows written, or the exception on failure
+    """
+    cmd = "SELECT id, first_name, last_name, phone_number, email_address FROM Employee ORDER BY id"
+    return export_query(conn, cmd, (), stream, fmt, EMPLOYEE_FIELDS, chunk_size)
+
+
+def export_tasks(conn, stream, fmt="csv", is_complete="", employee_id=0, text="", chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Export tasks filtered like query_tasks, each task once.
+    :param conn: Connection
+    :param stream: text file object
+    :param fmt: String "csv" or "jsonl"
+    :param is_complete: String
+    :param employee_id: int
+    :param text: String full-text search
+    :param chunk_size: int
+    :return: int rows written, or the exception on failure
+    """
+    where, params = task_filter_clause(is_complete, employee_id, text)
+    cmd = ("SELECT Task.id, Task.customer_name, Task.job_description, Task.price, Task.estimated_hours "
+           "FROM Task WHERE 1=1" + where + " ORDER BY Task.id")
+    return export_query(conn, cmd, params, stream, fmt, TASK_FIELDS, chunk_size)
+
+
+def export_assignments(conn, stream, fmt="csv", is_completed="", chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Export assignments filtered like query_assignments, with completed written as "yes"/"no".
+    :param conn: Connection
+    :param stream: text file object
+    :param fmt: String "csv" or "jsonl"
+    :param is_completed: String
+    :param chunk_size: int
+    :return: int rows written, or the exception on failure
+    """
+    cmd = ("SELECT id, employee_id, task_id, CASE WHEN completed = 1 THEN 'yes' ELSE 'no' END, completed_at "
+           "FROM Assignment WHERE 1=1")
+    if is_completed:
+        cmd += " AND " + completed_condition("completed", is_completed)
+    cmd += " ORDER BY id"
+    return export_query(conn, cmd, (), stream, fmt, ASSIGNMENT_FIELDS, chunk_size)
+
+
+def export_query(conn, cmd, params, stream, fmt, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Write the rows of cmd to stream as they are read. Rows stay plain tuples and at most
+    chunk_size of them are in memory, so memory use does not grow with the table.
+    :param conn: Connection
+    :param cmd: String
+    :param params: tuple
+    :param stream: text file object
+    :param fmt: String "csv" or "jsonl"
+    :param fields: tuple of String column names
+    :param chunk_size: int
+    :return: int rows written, or the exception on failure
+    """
+    written = 0
+    try:
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError("Unknown export format: " + str(fmt))
+        with closing(conn.cursor()) as cursor:
+            cursor.execute(cmd, params)
+            if fmt == "csv":
+                writer = csv.writer(stream)
+                writer.writerow(fields)
+            rows = cursor.fetchmany(chunk_size)
+            while rows:
+                if fmt == "csv":
+                    writer.writerows(rows)
+                else:
+                    stream.write("".join(json.dumps(dict(zip(fields, row))) + "\n" for row in rows))
+                written += len(rows)
+                rows = cursor.fetchmany(chunk_size)
+        return written
+    except Exception as e:
+        print("export_query(): ", e)
+        return e
@@ -0,0 +1,371 @@
+"""
+Help_Desk_CLI.py: Command line entry point for scripted bulk operations, usable without a display.
+Alec Shellberg
+10/18/2026
+
+python -m IT_Task_Manager.Help_Desk_CLI import tasks tasks.csv
+python -m IT_Task_Manager.Help_Desk_CLI query tasks --completed no --employee 3
+python -m IT_Task_Manager.Help_Desk_CLI update-status yes "12-40, 55"
+python -m IT_Task_Manager.Help_Desk_CLI export assignments --completed yes --output done.jsonl.gz
+python -m IT_Task_Manager.Help_Desk_CLI archive --older-than-days 180
+"""
+
+import argparse
+import gzip
+import sys
+
+# Database_Tier and the model classes are imported inside the commands that need them,
+# so --help and argument errors return without touching sqlite, and tkinter is never loaded.
+
+# column order of each table in imported and exported files, id excluded
+IMPORT_FIELDS = {"employees": ("first_name", "last_name", "phone_number", "email_address"),
+                 "tasks": ("customer_name", "job_description", "price", "estimated_hours"),
+                 "assignments": ("employee_id", "task_id", "completed")}
+EXPORT_FIELDS = {"employees": ("id",) + IMPORT_FIELDS["employees"],
+                 "tasks": ("id",) + IMPORT_FIELDS["tasks"],
+                 "assignments": ("id",) + IMPORT_FIELDS["assignments"] + ("completed_at",)}
+
+
+def open_connection(args):
+    """
+    :param args: argparse.Namespace
+    :return: Connection with the schema migrated
+    """
+    from IT_Task_Manager.Database_Tier import create_connection, init_tables
+    conn = create_connection(args.database)
+    if conn is None:
+        sys.exit("Could not open " + args.database)
+    resp = init_tables(conn)
+    if isinstance(resp, Exception):
+        sys.exit("Could not migrate " + args.database + ": " + str(resp))
+    return conn
+
+
+def file_format(path, requested):
+    """
+    :param path: String
+    :param requested: String "csv", "jsonl" or None to go by the file extension
+    :return: String
+    """
+    if requested:
+        return requested
+    return "jsonl" if path.endswith((".jsonl", ".json", ".jsonl.gz", ".json.gz")) else "csv"
+
+
+def read_records(stream, fmt):
+    """
+    :param stream: text file object
+    :param fmt: String "csv" or "jsonl"
+    :return: Generator[dict] one record per line, read lazily
+    """
+    if fmt == "csv":
+        import csv
+        yield from csv.DictReader(stream)
+    else:
+        import json
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def build_objects(table, records, rejected):
+    """
+    Convert records lazily; a record with a missing field or a bad value is skipped, not fatal.
+    :param table: String
+    :param records: Iterable[dict]
+    :param rejected: list receiving (record index, record, error) for every skipped record
+    :return: Generator of Employee, Task or Assignment objects
+    """
+    convert = model_converter(table)
+    for index, record in enumerate(records):
+        try:
+            item = convert(record)
+        except KeyError as e:
+            rejected.append((index, record, ValueError("missing field " + str(e))))
+            continue
+        except (TypeError, ValueError) as e:
+            rejected.append((index, record, e))
+            continue
+        yield item
+
+
+def model_converter(table):
+    """
+    :param table: String
+    :return: function(dict) -> Employee, Task or Assignment, raising KeyError/TypeError/ValueError on bad input
+    """
+    if table == "employees":
+        from IT_Task_Manager.Employee import Employee
+        return lambda record: Employee(None, record["first_name"], record["last_name"], record["phone_number"],
+                                       record["email_address"])
+    if table == "tasks":
+        from IT_Task_Manager.Task import Task
+        return lambda record: Task(None, record["customer_name"], record["job_description"],
+                                   float(record["price"]), float(record["estimated_hours"]))
+    from IT_Task_Manager.Assignment import Assignment
+    from IT_Task_Manager.Database_Tier import COMPLETED_FLAGS
+
+    def convert(record):
+        completed = str(record.get("completed") or "no").lower()
+        if completed not in COMPLETED_FLAGS:
+            raise ValueError("completed must be yes or no, not " + repr(record.get("completed")))
+        return Assignment(None, int(record["employee_id"]), int(record["task_id"]), completed)
+    return convert
+
+
+def record_index(index, skipped):
+    """
+    :param index: int position among the records that were converted
+    :param skipped: List[int] sorted positions of the records build_objects skipped
+    :return: int position of that record in the input file
+    """
+    for position in skipped:
+        if position > index:
+            break
+        index += 1
+    return index
+
+
+def open_import(path):
+    """
+    :param path: String file to import, "-" for stdin, gzip-decompressed when it ends in .gz
+    :return: text file object
+    """
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="", encoding="utf-8")
+    return open(path, newline="", encoding="utf-8")
+
+
+def import_command(args):
+    """
+    Stream a CSV or JSONL file, optionally gzipped, into the bulk insert functions.
+    :param args: argparse.Namespace
+    :return: int exit status, 1 when the import failed or any record was rejected
+    """
+    from IT_Task_Manager.Database_Tier import bulk_add_employees, bulk_add_tasks, bulk_add_assignments
+    bulk_add = {"employees": bulk_add_employees, "tasks": bulk_add_tasks, "assignments": bulk_add_assignments}
+    conn = open_connection(args)
+    stream = open_import(args.file)
+    rejected = []
+    try:
+        records = read_records(stream, file_format(args.file, args.format))
+        report = bulk_add[args.table](conn, build_objects(args.table, records, rejected), args.chunk_size)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        conn.close()
+    skipped = [index for index, _, _ in rejected]
+    failed = rejected + [(record_index(index, skipped), row, e) for index, row, e in report["failed"]]
+    for index, row, e in sorted(failed, key=lambda failure: failure[0]):
+        print("import: record " + str(index + 1) + " rejected: " + str(e), file=sys.stderr)
+    if "error" in report:
+        print("import: ", report["error"], file=sys.stderr)
+        return 1
+    print("Imported " + str(sum(report["chunks"])) + " " + args.table + ".")
+    return 1 if failed else 0
+
+
+def model_values(table, item):
+    """
+    :param table: String
+    :param item: Employee, Task or Assignment
+    :return: tuple in EXPORT_FIELDS order
+    """
+    if table == "employees":
+        return (item.get_id(), item.get_first_name(), item.get_last_name(), item.get_phone(), item.get_email())
+    if table == "tasks":
+        return (item.get_id(), item.get_customer_name(), item.get_description(), item.get_price(), item.get_hours())
+    return (item.get_id(), item.get_employee_id(), item.get_task_id(), item.get_completed(),
+            item.get_completed_at())
+
+
+def export_command(args):
+    """
+    :param args: argparse.Namespace
+    :return: int exit status
+    """
+    from IT_Task_Manager.Export import open_export, export_employees, export_tasks, export_assignments
+    conn = open_connection(args)
+    fmt = file_format(args.output, args.format)
+    if args.output == "-":
+        stream = sys.stdout
+    else:
+        stream = open_export(args.output, True if args.gzip else None)
+    try:
+        if args.table == "employees":
+            written = export_employees(conn, stream, fmt)
+        elif args.table == "tasks":
+            written = export_tasks(conn, stream, fmt, args.completed, args.employee, args.search)
+        else:
+            written = export_assignments(conn, stream, fmt, args.completed)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+        conn.close()
+    if isinstance(written, Exception):
+        print("export: ", written, file=sys.stderr)
+        return 1
+    if stream is not sys.stdout:
+        print("Exported " + str(written) + " " + args.table + ".")
+    return 0
+
+
+def query_command(args):
+    """
+    Print one window of rows, tab separated, sorted and filtered in SQL.
+    :param args: argparse.Namespace
+    :return: int exit status
+    """
+    from IT_Task_Manager.Database_Tier import query_employees_window, query_tasks_window, query_assignments_window, \
+        EMPLOYEE_SORT_COLUMNS, TASK_SORT_COLUMNS, ASSIGNMENT_SORT_COLUMNS
+    # the sortable columns depend on the table argument, so they are checked here rather than by argparse
+    sort_columns = {"employees": EMPLOYEE_SORT_COLUMNS, "tasks": TASK_SORT_COLUMNS,
+                    "assignments": ASSIGNMENT_SORT_COLUMNS}[args.table]
+    if args.order_by not in sort_columns:
+        print("query: --order-by for " + args.table + " must be one of: " + ", ".join(sort_columns),
+              file=sys.stderr)
+        return 2
+    conn = open_connection(args)
+    try:
+        if args.include_archive:
+            from IT_Task_Manager.Archive import attach_archive
+            from IT_Task_Manager.config import archive_path_for
+            attach_archive(conn, args.archive or archive_path_for(args.database))
+        if args.table == "employees":
+            items = query_employees_window(conn, args.offset, args.limit, args.order_by, args.descending)
+        elif args.table == "tasks":
+            items = query_tasks_window(conn, args.offset, args.limit, args.order_by, args.descending,
+                                       args.completed, args.employee, args.search, args.include_archive)
+        else:
+            items = query_assignments_window(conn, args.offset, args.limit, args.order_by, args.descending,
+                                             args.completed, args.include_archive)
+    finally:
+        conn.close()
+    print("\t".join(EXPORT_FIELDS[args.table]))
+    for item in items:
+        print("\t".join("" if value is None else str(value) for value in model_values(args.table, item)))
+    return 0
+
+
+def update_status_command(args):
+    """
+    :param args: argparse.Namespace
+    :return: int exit status
+    """
+    from IT_Task_Manager.Database_Tier import parse_id_ranges, bulk_update_assignment_status
+    try:
+        ids = parse_id_ranges(args.ids)
+    except ValueError as e:
+        print("update-status: ", e, file=sys.stderr)
+        return 2
+    conn = open_connection(args)
+    try:
+        changed = bulk_update_assignment_status(conn, args.status, ids)
+    finally:
+        conn.close()
+    if isinstance(changed, Exception):
+        print("update-status: ", changed, file=sys.stderr)
+        return 1
+    print("Updated " + str(changed) + " assignment(s).")
+    return 0
+
+
+def archive_command(args):
+    """
+    Move tasks whose assignments were all completed before the cutoff into the archive database.
+    :param args: argparse.Namespace
+    :return: int exit status
+    """
+    from IT_Task_Manager.Archive import attach_archive, archive_completed, cutoff_days_ago
+    from IT_Task_Manager.config import archive_path_for
+    cutoff = args.before or cutoff_days_ago(args.older_than_days)
+    conn = open_connection(args)
+    try:
+        attach_archive(conn, args.archive or archive_path_for(args.database))
+        moved = archive_completed(conn, cutoff, args.batch_size)
+    except Exception as e:
+        moved = e
+    finally:
+        conn.close()
+    if isinstance(moved, Exception):
+        print("archive: ", moved, file=sys.stderr)
+        return 1
+    print("Archived " + str(moved["tasks"]) + " task(s) and " + str(moved["assignments"])
+          + " assignment(s) completed before " + cutoff + ".")
+    return 0
+
+
+def build_parser():
+    """
+    :return: argparse.ArgumentParser
+    """
+    from IT_Task_Manager.config import database_path
+    parser = argparse.ArgumentParser(prog="Help_Desk_CLI", description="Help desk database operations.")
+    parser.add_argument("--database", default=database_path, help="database file (default: %(default)s)")
+    parser.add_argument("--archive", help="archive database file (default: next to the database, "
+                                           "e.g. Help_Desk_Archive.db beside Help_Desk.db)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="bulk insert rows from a CSV or JSONL file")
+    import_parser.add_argument("table", choices=sorted(IMPORT_FIELDS))
+    import_parser.add_argument("file", help="input file, gzip-compressed if it ends in .gz, or - for stdin")
+    import_parser.add_argument("--format", choices=("csv", "jsonl"))
+    import_parser.add_argument("--chunk-size", type=int, default=5000)
+    import_parser.set_defaults(run=import_command)
+
+    export_parser = commands.add_parser("export", help="write rows to a CSV or JSONL file")
+    export_parser.add_argument("table", choices=sorted(EXPORT_FIELDS))
+    export_parser.add_argument("--output", default="-", help="output file, or - for stdout")
+    export_parser.add_argument("--format", choices=("csv", "jsonl"))
+    export_parser.add_argument("--gzip", action="store_true", help="compress the output (implied by a .gz name)")
+    add_filter_arguments(export_parser)
+    export_parser.add_argument("--search", default="", help="full-text search over tasks")
+    export_parser.set_defaults(run=export_command)
+
+    query_parser = commands.add_parser("query", help="print rows matching filters")
+    query_parser.add_argument("table", choices=sorted(EXPORT_FIELDS))
+    add_filter_arguments(query_parser)
+    query_parser.add_argument("--search", default="", help="full-text search over tasks")
+    query_parser.add_argument("--order-by", default="id", help="sort column of the chosen table (default: %(default)s)")
+    query_parser.add_argument("--descending", action="store_true")
+    query_parser.add_argument("--offset", type=int, default=0)
+    query_parser.add_argument("--limit", type=int, default=100)
+    query_parser.add_argument("--include-archive", action="store_true", help="also read archived tasks/assignments")
+    query_parser.set_defaults(run=query_command)
+
+    update_parser = commands.add_parser("update-status", help="set the completed status of many assignments")
+    update_parser.add_argument("status", choices=("yes", "no"))
+    update_parser.add_argument("ids", help='assignment ids and ranges, e.g. "12-40, 55"')
+    update_parser.set_defaults(run=update_status_command)
+
+    archive_parser = commands.add_parser("archive", help="move old completed work into the archive database")
+    cutoff = archive_parser.add_mutually_exclusive_group()
+    cutoff.add_argument("--older-than-days", type=float, default=90, help="completed more than this many days ago")
+    cutoff.add_argument("--before", help='completed before this UTC timestamp, e.g. "2026-01-01 00:00:00"')
+    archive_parser.add_argument("--batch-size", type=int, default=500, help="tasks moved per transaction")
+    archive_parser.set_defaults(run=archive_command)
+    return parser
+
+
+def add_filter_arguments(parser):
+    """
+    :param parser: argparse.ArgumentParser
+    :return: None
+    """
+    parser.add_argument("--completed", choices=("yes", "no"), default="", help="tasks/assignments by status")
+    parser.add_argument("--employee", type=int, default=0, help="tasks assigned to this employee id")
+
+
+def main(argv=None):
+    """
+    :param argv: List[String] or None for sys.argv
+    :return: int exit status
+    """
+    args = build_parser().parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
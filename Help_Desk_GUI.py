@@ -6,47 +6,411 @@ Alec Shellberg
 
 import tkinter as tk
 from tkinter import ttk, StringVar
-from tkinter.scrolledtext import ScrolledText
 
+from IT_Task_Manager.Archive import ARCHIVE_AFTER_DAYS, attach_archive, archive_batch, cutoff_days_ago
 from IT_Task_Manager.Assignment import Assignment
-from IT_Task_Manager.Database_Tier import create_connection, init_tables, reset_tables, \
-    query_employees, retrieve_employee_names, query_tasks, query_assignments, add_task, add_assignment, \
-    update_assignment_status
+from IT_Task_Manager.Auto_Assign import auto_assign
+from IT_Task_Manager.Change_Monitor import ChangeMonitor
+from IT_Task_Manager.Database_Tier import init_tables, seed_demo_data, add_task, \
+    add_assignment, update_assignment_status, bulk_update_assignment_status, parse_id_ranges, get_assignment
+from IT_Task_Manager.Database_Worker import DatabaseWorker
+from IT_Task_Manager.Employee_Directory import EmployeeDirectory
+from IT_Task_Manager.Instrumentation import instrumentation
+from IT_Task_Manager.Query_Cache import query_cache, cached_count_employees, cached_count_tasks, cached_count_assignments, \
+    cached_query_employees_window, cached_query_tasks_window, cached_query_assignments_window
+from IT_Task_Manager.Reports import WORKLOAD_COLUMNS, workload_report, workload_totals
+from IT_Task_Manager.Startup_Profiler import StartupProfiler
 from IT_Task_Manager.Task import Task
+from IT_Task_Manager.Virtual_Table import VirtualTable
+
+# milliseconds between checks for finished background database jobs
+POLL_INTERVAL = 25
+# milliseconds of typing pause before the employee selector searches
+SEARCH_DELAY = 150
+# milliseconds between checks for changes made by other processes
+LIVE_REFRESH_INTERVAL = 1000
 
 
 class HelpDeskGUI(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.conn = create_connection()
-        reset_tables(self.conn)
-        init_tables(self.conn)
+    def __init__(self, profiler=None):
+        """
+        :param profiler: StartupProfiler, or None to start without profiling
+        """
+        profiler = profiler or StartupProfiler(enabled=False)
+        with profiler.phase("create window"):
+            super().__init__()
+        self.profiler = profiler
+        self.worker = DatabaseWorker()
+        self.__pending = {}
+        self.__in_flight = set()
+        self.busy_indicator = ttk.Progressbar(self, mode="indeterminate", length=120)
+        self.__busy_shown = False
+        # packed before any job is submitted, the busy indicator is packed relative to it
         self.__notebook = ttk.Notebook(self)
-        self.task_column_names = ["TASK_ID", "CUSTOMER", "DESCRIPTION", "PRICE", "EST._HOURS"]
-        self.employee_column_names = ["EMPLOYEE_ID", "FIRST_NAME", "LAST_NAME", "PHONE #", "EMAIL"]
-        self.assignment_column_names = ["ASSIGNMENT_ID", "EMPLOYEE_ID", "TASK_ID", "COMPLETED"]
-        self.__notebook.add(self.build_tasks_tab(), text="Tasks")
-        self.__notebook.add(self.build_employees_tab(), text="Employees")
-        self.__notebook.add(self.build_assignments_tab(), text="Assignments")
         self.__notebook.pack(expand=True, fill="both")
+        self.run_in_background(None, self.profiler.timed("schema setup", init_tables))
+        self.employee_directory = EmployeeDirectory()
+        self.employee_search = None
+        self.task_search = None
+        self.task_filter = ("", 0, "")
+        self.assignment_filter = ""
+        # read the attached archive as well as the hot tables
+        self.include_archive = tk.BooleanVar(self, value=False)
+        # (heading, sort column) pairs for each table
+        self.task_columns = [("TASK_ID", "id"), ("CUSTOMER", "customer_name"), ("DESCRIPTION", "job_description"),
+                             ("PRICE", "price"), ("EST._HOURS", "estimated_hours")]
+        self.employee_columns = [("EMPLOYEE_ID", "id"), ("FIRST_NAME", "first_name"), ("LAST_NAME", "last_name"),
+                                 ("PHONE #", "phone_number"), ("EMAIL", "email_address")]
+        self.assignment_columns = [("ASSIGNMENT_ID", "id"), ("EMPLOYEE_ID", "employee_id"), ("TASK_ID", "task_id"),
+                                   ("COMPLETED", "completed")]
+        # widgets of tabs not built yet; each tab is built, and runs its first query, when first selected
+        self.task_table = None
+        self.employees_table = None
+        self.assignments_table = None
+        self.employee_selector = None
+        self.workload_tree = None
+        self.__unbuilt_tabs = {}
+        for text, build in (("Tasks", self.build_tasks_tab), ("Employees", self.build_employees_tab),
+                            ("Assignments", self.build_assignments_tab), ("Reports", self.build_reports_tab)):
+            tab = ttk.Frame(self.__notebook)
+            tk.Label(tab, text="Loading " + text.lower() + "...").pack(pady=50)
+            self.__notebook.add(tab, text=text)
+            self.__unbuilt_tabs[str(tab)] = (text, build)
+        self.reports_tab = tab
+        self.__notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        self.on_tab_changed(None)
+        self.build_menu()
         self.title("Help Desk Tracking System")
         self.geometry("1000x500")
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.change_monitor = ChangeMonitor()
+        self.poll_for_changes()
+        # hidden diagnostics panel
+        self.bind("<Control-Shift-D>", lambda event: self.show_diagnostics())
+        self.after_idle(self.profiler.mark, "window ready")
         self.mainloop()
 
 
-    def build_tasks_tab(self):
+    def build_menu(self):
+        """
+        :return: None
+        """
+        menu_bar = tk.Menu(self)
+        database_menu = tk.Menu(menu_bar, tearoff=0)
+        database_menu.add_command(label="Seed demo data",
+                                  command=lambda: self.run_in_background(None, seed_demo_data,
+                                                                         on_done=self.on_demo_data_seeded))
+        database_menu.add_command(label="Auto-assign unassigned tasks",
+                                  command=lambda: self.run_in_background(None, auto_assign,
+                                                                         on_done=self.on_tasks_auto_assigned))
+        database_menu.add_separator()
+        database_menu.add_command(label="Archive work completed over " + str(ARCHIVE_AFTER_DAYS) + " days ago",
+                                  command=self.archive_old_work)
+        database_menu.add_checkbutton(label="Include archived history", variable=self.include_archive,
+                                      command=self.on_include_archive_toggled)
+        menu_bar.add_cascade(label="Database", menu=database_menu)
+        self.config(menu=menu_bar)
+
+
+    def on_tasks_auto_assigned(self, report):
+        """
+        :param report: dict or Exception
+        :return: None
+        """
+        if isinstance(report, Exception):
+            self.reusable_popup(report)
+            return
+        if report["assigned"]:
+            self.reload_table(self.task_table)
+            self.reload_table(self.assignments_table)
+        self.reusable_popup("Assigned " + str(report["assigned"]) + " task(s).")
+
+
+    def archive_old_work(self):
+        """
+        Archive in batches, one worker job per batch, so interactive queries queued in between stay responsive.
+        :return: None
+        """
+        cutoff = cutoff_days_ago(ARCHIVE_AFTER_DAYS)
+        self.run_in_background(None, attach_archive, on_done=lambda _: self.archive_next_batch(cutoff, 0, (0, 0)))
+
+
+    def archive_next_batch(self, cutoff, after_task_id, moved):
+        """
+        :param cutoff: String timestamp
+        :param after_task_id: int last task id archived so far
+        :param moved: (int, int) tasks and assignments archived so far
+        :return: None
+        """
+        self.run_in_background(None, archive_batch, cutoff, after_task_id,
+                               on_done=lambda result: self.on_batch_archived(cutoff, moved, result))
+
+
+    def on_batch_archived(self, cutoff, moved, result):
+        """
+        :param cutoff: String timestamp
+        :param moved: (int, int) tasks and assignments archived before this batch
+        :param result: (int, int, int or None) from archive_batch
+        :return: None
+        """
+        tasks, assignments, last_task_id = result
+        moved = (moved[0] + tasks, moved[1] + assignments)
+        if last_task_id is not None:
+            self.archive_next_batch(cutoff, last_task_id, moved)
+            return
+        if moved[0]:
+            self.reload_table(self.task_table)
+            self.reload_table(self.assignments_table)
+        self.reusable_popup("Archived " + str(moved[0]) + " task(s) and " + str(moved[1]) + " assignment(s).")
+
+
+    def on_include_archive_toggled(self):
+        """
+        Attach the archive before the first query that reads it, then re-run every view with the new setting.
+        :return: None
+        """
+        if not self.include_archive.get():
+            self.reload_history_views()
+            return
+        # stays unchecked unless the archive attaches
+        self.include_archive.set(False)
+        self.run_in_background(None, attach_archive,
+                               on_done=lambda _: (self.include_archive.set(True), self.reload_history_views()))
+
+
+    def reload_history_views(self):
+        """
+        :return: None
+        """
+        self.refresh_tasks(*self.task_filter)
+        self.refresh_assignments(self.assignment_filter)
+        if self.__notebook.select() == str(self.reports_tab):
+            self.refresh_reports()
+
+
+    def on_demo_data_seeded(self, resp):
+        """
+        :param resp: String
+        :return: None
+        """
+        self.reload_table(self.task_table)
+        self.reload_table(self.employees_table)
+        self.reload_table(self.assignments_table)
+        self.load_employee_names()
+        self.reusable_popup(resp)
+
+
+    @staticmethod
+    def reload_table(table):
+        """
+        :param table: VirtualTable, or None while its tab is unbuilt (it loads fresh data when built)
+        :return: None
+        """
+        if table is not None:
+            table.reload()
+
+
+    def run_in_background(self, key, fn, *args, on_done=None, show_busy=True):
+        """
+        Run fn(conn, *args) on the database worker and hand its result to on_done on the Tk thread.
+        A newer job submitted under the same key cancels the older one, whose result is then dropped.
+        :param key: String or None (writes use None so they are never cancelled)
+        :param fn: function
+        :param on_done: function or None
+        :param show_busy: bool show the progress bar while the job runs
+        :return: None
+        """
+        stale = self.__pending.get(key) if key is not None else None
+        if stale is not None:
+            self.worker.cancel(stale)
+        future = self.worker.submit(fn, *args)
+        if key is not None:
+            self.__pending[key] = future
+        if show_busy:
+            self.__in_flight.add(future)
+            self.update_busy_indicator()
+        self.after(POLL_INTERVAL, self.poll_background_job, key, future, on_done)
+
+
+    def poll_background_job(self, key, future, on_done):
         """
-        :return: ttk.Frame
+        :param key: String or None
+        :param future: Future
+        :param on_done: function or None
+        :return: None
+        """
+        if not future.done():
+            self.after(POLL_INTERVAL, self.poll_background_job, key, future, on_done)
+            return
+        self.__in_flight.discard(future)
+        self.update_busy_indicator()
+        if key is not None:
+            if self.__pending.get(key) is not future:
+                return
+            del self.__pending[key]
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            self.reusable_popup(e)
+            return
+        if on_done is not None:
+            on_done(result)
+
+
+    def poll_for_changes(self):
+        """
+        Ask the worker, every LIVE_REFRESH_INTERVAL, whether another process changed the database.
+        :return: None
+        """
+        self.after(LIVE_REFRESH_INTERVAL, self.poll_for_changes)
+        self.run_in_background("live_refresh", self.change_monitor.poll, on_done=self.on_tables_changed,
+                               show_busy=False)
+
+
+    def on_tables_changed(self, changed):
+        """
+        Reload only the views that read a changed table, keeping their filters and scroll position.
+        :param changed: set of String table names
+        :return: None
+        """
+        if not changed:
+            return
+        if changed & {"Task", "Assignment"}:
+            self.reload_table(self.task_table)
+        if "Assignment" in changed:
+            self.reload_table(self.assignments_table)
+        if "Employee" in changed:
+            self.reload_table(self.employees_table)
+            self.load_employee_names()
+        if self.__notebook.select() == str(self.reports_tab):
+            self.refresh_reports()
+
+
+    def update_busy_indicator(self):
+        """
+        Show the progress bar while any database job is in flight.
+        :return: None
+        """
+        # a flag rather than winfo_ismapped(), which stays 0 until the window itself is mapped
+        if self.__in_flight and not self.__busy_shown:
+            self.busy_indicator.pack(side=tk.BOTTOM, anchor=tk.E, padx=10, pady=5, before=self.__notebook)
+            self.busy_indicator.start()
+            self.__busy_shown = True
+        elif not self.__in_flight and self.__busy_shown:
+            self.busy_indicator.stop()
+            self.busy_indicator.pack_forget()
+            self.__busy_shown = False
+
+
+    def close(self):
+        """
+        Stop the database worker and close the window.
+        :return: None
+        """
+        self.worker.stop()
+        self.destroy()
+
+
+    def refresh_tasks(self, is_complete="", employee_id=0, text=""):
+        """
+        :param is_complete: String
+        :param employee_id: int
+        :param text: String full-text search over customer name and description
+        :return: None
+        """
+        self.task_filter = (is_complete, employee_id, text)
+        if self.task_table is None:
+            return
+        self.task_table.set_query(cached_count_tasks, cached_query_tasks_window, is_complete, employee_id, text,
+                                  self.include_archive.get())
+
+
+    def refresh_employees(self):
+        """
+        :return: None
+        """
+        self.employees_table.set_query(cached_count_employees, cached_query_employees_window)
+
+
+    def refresh_assignments(self, is_completed=""):
+        """
+        :param is_completed: String
+        :return: None
+        """
+        self.assignment_filter = is_completed
+        if self.assignments_table is None:
+            return
+        self.assignments_table.set_query(cached_count_assignments, cached_query_assignments_window, is_completed,
+                                         self.include_archive.get())
+
+
+    @staticmethod
+    def task_row(task):
+        """
+        :param task: Task
+        :return: tuple
+        """
+        return task.get_id(), task.get_customer_name(), task.get_description(), task.get_price(), task.get_hours()
+
+
+    @staticmethod
+    def employee_row(employee):
+        """
+        :param employee: Employee
+        :return: tuple
+        """
+        return (employee.get_id(), employee.get_first_name(), employee.get_last_name(),
+                employee.get_phone(), employee.get_email())
+
+
+    @staticmethod
+    def assignment_row(assignment):
+        """
+        :param assignment: Assignment
+        :return: tuple
+        """
+        return assignment.get_id(), assignment.get_employee_id(), assignment.get_task_id(), assignment.get_completed()
+
+
+    def visible_assignment_row(self, assignment):
+        """
+        :param assignment: Assignment or None
+        :return: tuple, or None when the assignment is outside the Assignments tab filter
+        """
+        if assignment is None or self.assignment_filter not in ("", assignment.get_completed()):
+            return None
+        return self.assignment_row(assignment)
+
+
+    def refresh_tasks_for(self, *assignments):
+        """
+        Re-count the Tasks tab if its filter depends on any of the given assignments.
+        :param assignments: Assignment
+        :return: None
+        """
+        is_complete, employee_id, _ = self.task_filter
+        if not is_complete and employee_id == 0:
+            return
+        for assignment in assignments:
+            if assignment is not None and employee_id in (0, assignment.get_employee_id()):
+                self.reload_table(self.task_table)
+                return
+
+
+    def build_tasks_tab(self, tasks_tab):
+        """
+        :param tasks_tab: ttk.Frame
+        :return: None
         """
-        tasks_tab = ttk.Frame(self.__notebook)
         display_container = ttk.Frame(tasks_tab)
         self.build_task_sort_controls(display_container)
         self.build_task_submission_form(tasks_tab)
-        self.task_table = ScrolledText(display_container, font=("Courier New", 10), border=5, relief="solid", height=20)
-        self.build_table(self.task_table, self.task_column_names, query_tasks(self.conn))
+        self.task_table = VirtualTable(display_container, self.task_columns, self.task_row, self.run_in_background)
+        self.refresh_tasks(*self.task_filter)
         display_container.pack()
         self.task_table.pack(expand=True)
-        return tasks_tab
 
 
     def build_task_sort_controls(self, parent):
@@ -69,22 +433,104 @@ class HelpDeskGUI(tk.Tk):
         no_selection.pack(side=tk.LEFT)
         radio_container.pack(pady=10)
         # create employee selection
-        employees = retrieve_employee_names(self.conn)
         selected_employee = tk.StringVar()
-        selected_employee.set(employees[0])
-        employee_selector = ttk.Combobox(controls_container, textvariable=selected_employee, values=employees)
+        selected_employee.set(EmployeeDirectory.ANY)
+        self.employee_selector = ttk.Combobox(controls_container, textvariable=selected_employee,
+                                              values=self.employee_directory.names())
+        self.employee_selector.bind("<KeyRelease>", self.on_employee_typed)
+        self.load_employee_names()
         employees_lbl = tk.Label(controls_container, text="Employee: ")
         employees_lbl.pack(side=tk.LEFT)
-        employee_selector.pack(side=tk.LEFT, padx=10)
+        self.employee_selector.pack(side=tk.LEFT, padx=10)
+        # full-text search, applied as the user types
+        search_text = tk.StringVar()
+        search_lbl = tk.Label(controls_container, text="Search: ")
+        search_lbl.pack(side=tk.LEFT)
+        search_entry = ttk.Entry(controls_container, textvariable=search_text)
+        search_entry.bind("<KeyRelease>", lambda event: self.on_task_search_typed(search_text.get()))
+        search_entry.pack(side=tk.LEFT, padx=10)
         # submit
         submit_btn = tk.Button(controls_container,
                                text="Submit",
-                               command=lambda:self.build_table(self.task_table, self.task_column_names, query_tasks(
-                                   self.conn, completed_var.get(), employees.index(selected_employee.get()))))
+                               command=lambda:self.validate_task_filter(completed_var.get(), selected_employee.get(),
+                                                                        search_text.get()))
         submit_btn.pack()
         controls_container.pack(pady=10)
 
 
+    def validate_task_filter(self, is_complete, employee_name, text=""):
+        """
+        :param is_complete: String
+        :param employee_name: String display name from the employee selector
+        :param text: String search box contents
+        :return: None
+        """
+        employee_id = self.employee_directory.employee_id(employee_name)
+        if employee_id is None:
+            self.reusable_popup("Unknown employee: " + employee_name)
+        else:
+            self.refresh_tasks(is_complete, employee_id, text.strip())
+
+
+    def on_task_search_typed(self, text):
+        """
+        Debounced search: re-run the Tasks query once typing pauses, keeping the applied status and employee filters.
+        :param text: String
+        :return: None
+        """
+        if self.task_search is not None:
+            self.after_cancel(self.task_search)
+        self.task_search = self.after(SEARCH_DELAY, self.search_tasks_for, text.strip())
+
+
+    def search_tasks_for(self, text):
+        """
+        :param text: String
+        :return: None
+        """
+        self.task_search = None
+        is_complete, employee_id, current = self.task_filter
+        if text != current:
+            self.refresh_tasks(is_complete, employee_id, text)
+
+
+    def load_employee_names(self):
+        """
+        Fill the Tasks tab employee selector from the directory, reloading it in the background if stale.
+        :return: None
+        """
+        if self.employee_selector is None:
+            return
+        self.run_in_background("employee_names", self.employee_directory.refresh,
+                               on_done=lambda names: self.employee_selector.config(values=names))
+
+
+    def on_employee_typed(self, event):
+        """
+        Debounced type-ahead: narrow the selector to employees matching what has been typed so far.
+        :param event: tk.Event
+        :return: None
+        """
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        if self.employee_search is not None:
+            self.after_cancel(self.employee_search)
+        self.employee_search = self.after(SEARCH_DELAY, self.search_employee_names, self.employee_selector.get())
+
+
+    def search_employee_names(self, text):
+        """
+        :param text: String
+        :return: None
+        """
+        self.employee_search = None
+        if not text.strip() or text == EmployeeDirectory.ANY:
+            self.employee_selector.config(values=self.employee_directory.names())
+            return
+        self.run_in_background("employee_search", self.employee_directory.search, text,
+                               on_done=lambda names: self.employee_selector.config(values=names))
+
+
     def build_task_submission_form(self, parent):
         """
         :param parent: ttk.Frame
@@ -118,9 +564,8 @@ class HelpDeskGUI(tk.Tk):
             try:
                 if float(price) >= 0 and float(hours) >= 0:
                     new_task = Task(None, name, desc, float(price), float(hours))
-                    resp = add_task(self.conn, new_task)
-                    self.build_table(self.task_table, self.task_column_names, query_tasks(self.conn))
-                    self.reusable_popup(resp)
+                    self.run_in_background(None, add_task, new_task,
+                                           on_done=lambda resp: self.on_task_added(new_task, resp))
                 else:
                     self.reusable_popup("Price and hours must be >= 0")
             except Exception as e:
@@ -129,33 +574,118 @@ class HelpDeskGUI(tk.Tk):
             self.reusable_popup("One or more fields incomplete.")
 
 
-    def build_employees_tab(self):
+    def on_task_added(self, task, resp):
         """
-        :return: ttk.Frame
+        A new task has no assignments, so it only shows up in the unfiltered Tasks view,
+        or in a text search that it may match.
+        :param task: Task
+        :param resp: String
+        :return: None
         """
-        emp_tab = ttk.Frame(self.__notebook)
-        self.employees_table = ScrolledText(emp_tab, font=("Courier New", 10), border=5, relief="solid", height=20)
-        self.build_table(self.employees_table, self.employee_column_names, query_employees(self.conn))
+        if task.get_id() is not None:
+            if self.task_filter == ("", 0, ""):
+                self.task_table.apply_change(None, self.task_row(task))
+            elif self.task_filter[:2] == ("", 0):
+                self.reload_table(self.task_table)
+        self.reusable_popup(resp)
+
+
+    def build_employees_tab(self, emp_tab):
+        """
+        :param emp_tab: ttk.Frame
+        :return: None
+        """
+        self.employees_table = VirtualTable(emp_tab, self.employee_columns, self.employee_row, self.run_in_background)
+        self.refresh_employees()
         self.employees_table.pack(expand=True)
-        return emp_tab
 
 
-    def build_assignments_tab(self):
+    def build_assignments_tab(self, assignments_tab):
         """
-        :return: ttk.Frame
+        :param assignments_tab: ttk.Frame
+        :return: None
         """
-        assignments_tab = ttk.Frame(self.__notebook)
         forms_container = ttk.Frame(assignments_tab)
         table_container = ttk.Frame(assignments_tab)
         self.build_assignment_status_update_form(forms_container)
         self.build_assignment_submission_form(forms_container)
-        self.assignments_table = ScrolledText(table_container, font=("Courier New", 10), border=5, relief="solid", height=20)
+        self.assignments_table = VirtualTable(table_container, self.assignment_columns, self.assignment_row,
+                                              self.run_in_background)
         self.build_assignments_sort_controls(table_container)
-        self.build_table(self.assignments_table, self.assignment_column_names, query_assignments(self.conn, ""))
+        self.refresh_assignments(self.assignment_filter)
         forms_container.pack(side=tk.LEFT)
         self.assignments_table.pack(expand=True)
         table_container.pack()
-        return assignments_tab
+
+
+    def build_reports_tab(self, reports_tab):
+        """
+        :param reports_tab: ttk.Frame
+        :return: None
+        """
+        report_lbl = tk.Label(reports_tab, text="Workload and revenue by technician:")
+        report_lbl.pack(pady=10)
+        self.workload_tree = ttk.Treeview(reports_tab, columns=WORKLOAD_COLUMNS, show="headings", height=15)
+        for heading in WORKLOAD_COLUMNS:
+            self.workload_tree.heading(heading, text=heading)
+            self.workload_tree.column(heading, width=105, anchor=tk.CENTER)
+        self.workload_tree.pack(expand=True)
+        refresh_btn = tk.Button(reports_tab, text="Refresh", command=self.refresh_reports)
+        refresh_btn.pack(pady=10)
+
+
+    def on_tab_changed(self, event):
+        """
+        Build a tab the first time it is selected. Reports read the trigger-maintained summary,
+        so they are cheap enough to reload on every visit.
+        :param event: tk.Event or None
+        :return: None
+        """
+        selected = self.__notebook.select()
+        if selected in self.__unbuilt_tabs:
+            # once idle, so the placeholder is drawn before the build starts
+            self.after_idle(self.build_tab, selected)
+        elif selected == str(self.reports_tab):
+            self.refresh_reports()
+
+
+    def build_tab(self, name):
+        """
+        Replace a tab's placeholder with its widgets and start loading its first page.
+        :param name: String Tk path name of the tab frame
+        :return: None
+        """
+        text, build = self.__unbuilt_tabs.pop(name, (None, None))
+        if build is None:
+            return
+        tab = self.nametowidget(name)
+        with self.profiler.phase("build " + text + " tab"):
+            for placeholder in tab.winfo_children():
+                placeholder.destroy()
+            build(tab)
+        if tab is self.reports_tab:
+            self.refresh_reports()
+
+
+    def refresh_reports(self):
+        """
+        :return: None
+        """
+        if self.workload_tree is None:
+            return
+        self.run_in_background("workload_report", workload_report, self.include_archive.get(),
+                               on_done=self.show_workload)
+
+
+    def show_workload(self, rows):
+        """
+        :param rows: List[tuple] in WORKLOAD_COLUMNS order
+        :return: None
+        """
+        self.workload_tree.delete(*self.workload_tree.get_children())
+        for row in rows + [workload_totals(rows)]:
+            self.workload_tree.insert("", tk.END, values=[round(value, 2) if isinstance(value, float) else value
+                                                          for value in row])
 
 
     def build_assignments_sort_controls(self, parent):
@@ -169,10 +699,7 @@ class HelpDeskGUI(tk.Tk):
         complete = ttk.Radiobutton(container, variable=completion_status, value="yes", text="Complete")
         incomplete = ttk.Radiobutton(container, variable=completion_status, value="no", text="Incomplete")
         show_all = ttk.Radiobutton(container, variable=completion_status, value="", text="All", takefocus=True)
-        submit = tk.Button(container, text="Submit", command=lambda:self.build_table(self.assignments_table,
-                                                                                self.assignment_column_names,
-                                                                                query_assignments(self.conn,
-                                                                                                  completion_status.get())))
+        submit = tk.Button(container, text="Submit", command=lambda:self.refresh_assignments(completion_status.get()))
         label.pack(side=tk.TOP)
         complete.pack(side=tk.LEFT)
         incomplete.pack(side=tk.LEFT)
@@ -189,7 +716,7 @@ class HelpDeskGUI(tk.Tk):
         container = ttk.Frame(parent, border=5, relief="sunken")
         label = tk.Label(container, text="Update completion status:")
         label.pack()
-        assignment_id = self.build_text_input_field(container, "Assignment ID: ")
+        assignment_id = self.build_text_input_field(container, "Assignment IDs: ")
         completed_values = ["no", "yes"]
         completed_selector_label = tk.Label(container, text="Completed: ")
         completed_value = StringVar()
@@ -203,18 +730,68 @@ class HelpDeskGUI(tk.Tk):
         container.pack(pady=10)
 
 
-    def validate_completion_status_update(self, assignment_id, new_status):
-        if len(assignment_id) > 0:
+    def validate_completion_status_update(self, assignment_ids, new_status):
+        """
+        Validate and execute a status update for one id or a list of ids and ranges such as "12-40,55".
+        :param assignment_ids: String
+        :param new_status: String
+        :return: None
+        """
+        if len(assignment_ids) > 0:
             try:
-                resp = update_assignment_status(self.conn, new_status, int(assignment_id))
-                self.build_table(self.assignments_table, self.assignment_column_names, query_assignments(self.conn, ""))
-                self.reusable_popup(resp)
+                ids = parse_id_ranges(assignment_ids)
+                if len(ids) == 1:
+                    self.run_in_background(None, self.change_assignment_status, new_status, ids[0],
+                                           on_done=self.on_assignment_status_changed)
+                else:
+                    self.run_in_background(None, bulk_update_assignment_status, new_status, ids,
+                                           on_done=self.on_assignment_statuses_changed)
             except Exception as e:
                 self.reusable_popup(e)
         else:
             self.reusable_popup("One or more invalid entries.")
 
 
+    @staticmethod
+    def change_assignment_status(conn, new_status, assignment_id):
+        """
+        Worker job: update one assignment and return it as it was before and after.
+        :param conn: Connection
+        :param new_status: String
+        :param assignment_id: int
+        :return: (String, Assignment or None, Assignment or None)
+        """
+        before = get_assignment(conn, assignment_id)
+        resp = update_assignment_status(conn, new_status, assignment_id)
+        return resp, before, get_assignment(conn, assignment_id)
+
+
+    def on_assignment_status_changed(self, result):
+        """
+        :param result: (String, Assignment or None, Assignment or None)
+        :return: None
+        """
+        resp, before, after = result
+        self.assignments_table.apply_change(self.visible_assignment_row(before), self.visible_assignment_row(after))
+        self.refresh_tasks_for(before, after)
+        self.reusable_popup(resp)
+
+
+    def on_assignment_statuses_changed(self, changed):
+        """
+        :param changed: int or Exception
+        :return: None
+        """
+        if isinstance(changed, Exception):
+            self.reusable_popup(changed)
+            return
+        if changed:
+            self.reload_table(self.assignments_table)
+            if self.task_filter[0]:
+                self.reload_table(self.task_table)
+        self.reusable_popup("Updated " + str(changed) + " assignment(s).")
+
+
     def build_assignment_submission_form(self, parent):
         """
         :param parent: ttk.Frame
@@ -250,33 +827,24 @@ class HelpDeskGUI(tk.Tk):
         if len(emp_id) > 0 and len(task_id) > 0 and len(completed_val) > 0:
             try:
                 new_assignment = Assignment(None, int(emp_id), int(task_id), completed_val)
-                resp = add_assignment(self.conn, new_assignment)
-                self.build_table(self.assignments_table, self.assignment_column_names, query_assignments(self.conn, ""))
-                self.reusable_popup(resp)
+                self.run_in_background(None, add_assignment, new_assignment,
+                                       on_done=lambda resp: self.on_assignment_added(new_assignment, resp))
             except Exception as e:
                 self.reusable_popup(e)
         else:
             self.reusable_popup("One or more invalid entries.")
 
 
-    def build_table(self, table, columns, data):
+    def on_assignment_added(self, assignment, resp):
         """
-        Build display tables for all tabs.
-        :param table: tk.Text
-        :param columns: list[str]
-        :param data: list[Object]
-        :return: tk.Text
+        :param assignment: Assignment
+        :param resp: String
+        :return: None
         """
-        table.config(state=tk.NORMAL)
-        table.delete("1.0", tk.END)
-        table_text = ""
-        for column in columns:
-            table_text += column.center(15, " ")
-        table_text += "\n"
-        for row in data:
-            table_text += str(row) +"\n"
-        table.insert(tk.END, table_text)
-        table.config(state=tk.DISABLED)
+        if assignment.get_id() is not None:
+            self.assignments_table.apply_change(None, self.visible_assignment_row(assignment))
+            self.refresh_tasks_for(assignment)
+        self.reusable_popup(resp)
 
 
     def build_text_input_field(self, parent, label_text):
@@ -295,6 +863,46 @@ class HelpDeskGUI(tk.Tk):
         return field
 
 
+    def show_diagnostics(self):
+        """
+        Window with the database tier timing statistics, recent slow calls and query cache counters.
+        :return: None
+        """
+        window = tk.Toplevel(self)
+        window.wm_title("Diagnostics")
+        text = tk.Text(window, width=150, height=40, wrap=tk.NONE, font="TkFixedFont")
+        buttons = ttk.Frame(window)
+        refresh_btn = tk.Button(buttons, text="Refresh", command=lambda: self.fill_diagnostics(text))
+        reset_btn = tk.Button(buttons, text="Reset",
+                              command=lambda: (instrumentation.reset(), self.fill_diagnostics(text)))
+        refresh_btn.pack(side=tk.LEFT, padx=10)
+        reset_btn.pack(side=tk.LEFT, padx=10)
+        buttons.pack(pady=5)
+        text.pack(expand=True, fill=tk.BOTH)
+        self.fill_diagnostics(text)
+
+
+    @staticmethod
+    def fill_diagnostics(text):
+        """
+        :param text: tk.Text
+        :return: None
+        """
+        lines = [instrumentation.report(), "",
+                 "Query cache: " + ", ".join(key + "=" + str(value) for key, value in query_cache.stats().items()), "",
+                 "Slow calls (>= " + str(instrumentation.slow_ms) + " ms, log: " + str(instrumentation.log_path) + "):"]
+        for call in reversed(instrumentation.recent_slow_calls()):
+            lines.append(call["time"] + "  " + call["function"] + "  " + str(call["elapsed_ms"]) + " ms  rows="
+                         + str(call["rows"]))
+            for statement in call["statements"]:
+                lines.append("    " + " ".join(statement["sql"].split()))
+                lines.extend("        " + detail for detail in statement["plan"])
+        text.config(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        text.insert(tk.END, "\n".join(lines))
+        text.config(state=tk.DISABLED)
+
+
     def reusable_popup(self, message):
         """
         Reusable popup box function.
@@ -309,4 +917,5 @@ class HelpDeskGUI(tk.Tk):
         button.pack(padx=10, pady=50)
 
 
-HelpDeskGUI()
+if __name__ == "__main__":
+    HelpDeskGUI()
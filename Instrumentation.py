@@ -0,0 +1,235 @@
+"""
+Instrumentation.py: Call counts, latency histograms, row counts and a slow query log for database tier functions.
+Alec Shellberg
+10/18/2026
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import closing
+from functools import wraps
+
+from IT_Task_Manager.config import slow_query_ms, slow_query_log
+
+# upper bounds, in milliseconds, of the latency histogram buckets; slower calls land in a final overflow bucket
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+# statements kept per call for the slow query log
+MAX_STATEMENTS = 20
+# slow calls kept in memory for the diagnostics panel
+RECENT_SLOW_CALLS = 50
+
+
+class Instrumentation:
+    """
+    Wraps functions taking a Connection as their first argument. While a wrapped call runs,
+    the connection's trace callback collects the SQL it executes with bound values expanded;
+    calls slower than slow_ms are appended to the slow query log as one JSON object per line,
+    with the EXPLAIN QUERY PLAN of each statement.
+    """
+    def __init__(self, slow_ms=slow_query_ms, log_path=slow_query_log):
+        """
+        :param slow_ms: float threshold for the slow query log
+        :param log_path: String JSON lines file, or None/"" to only keep slow calls in memory
+        """
+        self.slow_ms = slow_ms
+        self.log_path = log_path
+        self.__stats = {}
+        self.__recent_slow = deque(maxlen=RECENT_SLOW_CALLS)
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+
+
+    def instrumented(self, trace=True):
+        """
+        Decorator recording every call of fn(conn, ...).
+        :param trace: bool collect executed SQL; disable for bulk functions issuing one statement per row
+        :return: function
+        """
+        def decorate(fn):
+            @wraps(fn)
+            def wrapper(conn, *args, **kwargs):
+                return self.call(fn, trace, conn, *args, **kwargs)
+            return wrapper
+        return decorate
+
+
+    def call(self, fn, trace, conn, *args, **kwargs):
+        """
+        :param fn: function
+        :param trace: bool
+        :param conn: Connection
+        :return: whatever fn returns
+        """
+        # only the outermost instrumented call on a thread owns the trace callback
+        outermost = not getattr(self.__local, "active", False)
+        statements = []
+        if outermost:
+            self.__local.active = True
+            if trace:
+                conn.set_trace_callback(lambda sql: len(statements) < MAX_STATEMENTS and statements.append(sql))
+        start = time.perf_counter()
+        try:
+            result = fn(conn, *args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if outermost:
+                self.__local.active = False
+                if trace:
+                    conn.set_trace_callback(None)
+        rows = row_count(result)
+        self.record(fn.__name__, elapsed_ms, rows, is_error(result))
+        if outermost and elapsed_ms >= self.slow_ms:
+            self.log_slow_call(conn, fn.__name__, args, elapsed_ms, rows, statements)
+        return result
+
+
+    def record(self, name, elapsed_ms, rows, error):
+        """
+        :param name: String function name
+        :param elapsed_ms: float
+        :param rows: int or None
+        :param error: bool
+        :return: None
+        """
+        bucket = len(LATENCY_BUCKETS_MS)
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                bucket = index
+                break
+        with self.__lock:
+            stats = self.__stats.get(name)
+            if stats is None:
+                stats = {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0,
+                         "histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1)}
+                self.__stats[name] = stats
+            stats["calls"] += 1
+            stats["errors"] += error
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            stats["rows"] += rows or 0
+            stats["histogram"][bucket] += 1
+
+
+    def log_slow_call(self, conn, name, args, elapsed_ms, rows, statements):
+        """
+        :param conn: Connection
+        :param name: String
+        :param args: tuple arguments after the connection
+        :param elapsed_ms: float
+        :param rows: int or None
+        :param statements: List[String] expanded SQL
+        :return: None
+        """
+        entry = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 "function": name,
+                 "args": [repr(arg)[:200] for arg in args],
+                 "elapsed_ms": round(elapsed_ms, 3),
+                 "rows": rows,
+                 "statements": [{"sql": sql, "plan": query_plan(conn, sql)} for sql in statements
+                                if not sql.startswith("--")]}
+        with self.__lock:
+            self.__recent_slow.append(entry)
+        if not self.log_path:
+            return
+        try:
+            with open(self.log_path, "a") as log:
+                log.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            print("log_slow_call(): ", e)
+
+
+    def snapshot(self):
+        """
+        :return: dict of {function name: statistics} with mean latency added
+        """
+        with self.__lock:
+            snapshot = {}
+            for name, stats in self.__stats.items():
+                copy = dict(stats, histogram=list(stats["histogram"]))
+                copy["mean_ms"] = stats["total_ms"] / stats["calls"]
+                snapshot[name] = copy
+            return snapshot
+
+
+    def recent_slow_calls(self):
+        """
+        :return: List[dict] most recent slow calls, oldest first
+        """
+        with self.__lock:
+            return list(self.__recent_slow)
+
+
+    def reset(self):
+        """
+        :return: None
+        """
+        with self.__lock:
+            self.__stats.clear()
+            self.__recent_slow.clear()
+
+
+    def report(self):
+        """
+        Plain text table of the statistics, slowest total time first.
+        :return: String
+        """
+        buckets = ["<=" + str(bound) for bound in LATENCY_BUCKETS_MS] + [">" + str(LATENCY_BUCKETS_MS[-1])]
+        lines = ["function".ljust(34) + "calls".rjust(8) + "errors".rjust(8) + "mean_ms".rjust(10)
+                 + "max_ms".rjust(10) + "rows".rjust(10) + "  histogram (ms) " + " ".join(buckets)]
+        snapshot = self.snapshot()
+        for name in sorted(snapshot, key=lambda name: snapshot[name]["total_ms"], reverse=True):
+            stats = snapshot[name]
+            lines.append(name.ljust(34) + str(stats["calls"]).rjust(8) + str(stats["errors"]).rjust(8)
+                         + ("%.2f" % stats["mean_ms"]).rjust(10) + ("%.2f" % stats["max_ms"]).rjust(10)
+                         + str(stats["rows"]).rjust(10) + "  " + " ".join(str(count) for count in stats["histogram"]))
+        return "\n".join(lines)
+
+
+def query_plan(conn, sql):
+    """
+    :param conn: Connection
+    :param sql: String statement with its parameters already expanded
+    :return: List[String] plan details, or the error that prevented explaining it
+    """
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql)
+            return [row[3] for row in cursor.fetchall()]
+    except Exception as e:
+        return ["unavailable: " + str(e)]
+
+
+def row_count(result):
+    """
+    :param result: value returned by a database tier function
+    :return: int rows returned or written, None when the result is not a row set
+    """
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], list):
+        # (page, next page token)
+        return len(result[0])
+    if isinstance(result, dict) and "chunks" in result:
+        return sum(result["chunks"])
+    return None
+
+
+def is_error(result):
+    """
+    Database tier functions report failures by returning the exception, sometimes inside a tuple,
+    or for the bulk functions under the "error" key of their report.
+    :param result: Object
+    :return: bool
+    """
+    if isinstance(result, tuple):
+        return any(isinstance(item, Exception) for item in result)
+    if isinstance(result, dict):
+        return "error" in result
+    return isinstance(result, Exception)
+
+
+# shared instance used by Database_Tier
+instrumentation = Instrumentation()
+instrumented = instrumentation.instrumented
@@ -0,0 +1,203 @@
+"""
+Query_Cache.py: LRU cache of read query results, invalidated by the database tier's per-table write counters.
+Alec Shellberg
+10/18/2026
+"""
+
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import closing
+from functools import wraps
+
+from IT_Task_Manager.Database_Tier import table_generation, interrupt_generation, read_failure_generation, \
+    query_tasks, query_assignments, query_employees, count_employees, count_tasks, count_assignments, \
+    query_employees_window, query_tasks_window, query_assignments_window, query_tasks_with_assignments
+
+# default memory budget of the shared cache, in bytes of estimated result size
+CACHE_BUDGET_BYTES = 32 * 1024 * 1024
+
+
+class QueryCache:
+    """
+    Results are keyed by (function name, database file, arguments) and stored with the write
+    generation of every table the query reads. A lookup after a write to any of those tables
+    is a miss, as is one after another connection or process committed to the database
+    (PRAGMA data_version). Least recently used entries are evicted past the byte budget.
+    Cached lists are shared between callers and must not be modified.
+    """
+    def __init__(self, max_bytes=CACHE_BUDGET_BYTES):
+        """
+        :param max_bytes: int
+        """
+        self.__max_bytes = max_bytes
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+        # last PRAGMA data_version seen per connection; weak keys, so a new connection reusing
+        # a closed one's id() never inherits its version
+        self.__data_versions = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+
+    def cached(self, *tables):
+        """
+        Decorator caching fn(conn, *args, **kwargs) until one of tables is written.
+        :param tables: String table names the query reads
+        :return: function
+        """
+        def decorate(fn):
+            @wraps(fn)
+            def wrapper(conn, *args, **kwargs):
+                return self.call(conn, fn, tables, *args, **kwargs)
+            return wrapper
+        return decorate
+
+
+    def call(self, conn, fn, tables, *args, **kwargs):
+        """
+        :param conn: Connection
+        :param fn: function(conn, *args, **kwargs)
+        :param tables: tuple of String
+        :return: the cached or freshly computed result
+        """
+        database = self.database_of(conn)
+        if not self.check_data_version(conn, database):
+            # a plain sqlite3.Connection cannot be tracked, see Database_Tier.Connection
+            return fn(conn, *args, **kwargs)
+        key = (fn.__name__, database, args, tuple(sorted(kwargs.items())))
+        generations = tuple(table_generation(table) for table in tables)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] == generations:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        counters = (interrupt_generation(), read_failure_generation())
+        result = fn(conn, *args, **kwargs)
+        # an interrupted or failed query returns an empty result that must not be reused
+        if counters == (interrupt_generation(), read_failure_generation()):
+            self.store(key, generations, result)
+        return result
+
+
+    def store(self, key, generations, result):
+        """
+        :param key: tuple
+        :param generations: tuple of int table generations read before the query ran
+        :param result: Object
+        :return: None
+        """
+        size = estimate_size(result)
+        if size > self.__max_bytes:
+            return
+        with self.__lock:
+            old = self.__entries.pop(key, None)
+            if old is not None:
+                self.__bytes -= old[2]
+            self.__entries[key] = (generations, result, size)
+            self.__bytes += size
+            while self.__bytes > self.__max_bytes:
+                _, (_, _, evicted_size) = self.__entries.popitem(last=False)
+                self.__bytes -= evicted_size
+                self.evictions += 1
+
+
+    def database_of(self, conn):
+        """
+        :param conn: Connection
+        :return: String file of the main database, or a per-connection name for in-memory databases
+        """
+        with closing(conn.cursor()) as cursor:
+            cursor.execute("PRAGMA database_list")
+            return cursor.fetchone()[2] or ":memory:" + str(id(conn))
+
+
+    def check_data_version(self, conn, database):
+        """
+        Drop every entry for database when another connection has committed to it since conn last looked.
+        An in-memory database is private to its connection, and its name reuses id(conn), so its entries
+        are dropped the first time a connection is seen in case they belonged to a closed one.
+        :param conn: Connection
+        :param database: String
+        :return: bool False when conn cannot be weakly referenced and so must not be served from the cache
+        """
+        with closing(conn.cursor()) as cursor:
+            cursor.execute("PRAGMA data_version")
+            version = cursor.fetchone()[0]
+        with self.__lock:
+            try:
+                last = self.__data_versions.get(conn)
+                self.__data_versions[conn] = version
+            except TypeError:
+                return False
+        if last is None and database.startswith(":memory:"):
+            self.invalidate(database)
+        elif last is not None and last != version:
+            self.invalidate(database)
+        return True
+
+
+    def invalidate(self, database=None):
+        """
+        :param database: String or None for every database
+        :return: None
+        """
+        with self.__lock:
+            for key in [key for key in self.__entries if database is None or key[1] == database]:
+                self.__bytes -= self.__entries.pop(key)[2]
+            self.invalidations += 1
+
+
+    def stats(self):
+        """
+        :return: dict of hit/miss counters and current size
+        """
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "hit_ratio": self.hits / lookups if lookups else 0.0,
+                    "evictions": self.evictions,
+                    "invalidations": self.invalidations,
+                    "entries": len(self.__entries),
+                    "bytes": self.__bytes,
+                    "max_bytes": self.__max_bytes}
+
+
+def estimate_size(value):
+    """
+    Approximate memory held by a query result: containers, slotted model objects and their fields.
+    :param value: Object
+    :return: int bytes
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    elif hasattr(type(value), "__slots__"):
+        for cls in type(value).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name.startswith("__"):
+                    name = "_" + cls.__name__.lstrip("_") + name
+                size += estimate_size(getattr(value, name, None))
+    return size
+
+
+# shared cache used by the GUI
+query_cache = QueryCache()
+
+cached_query_employees = query_cache.cached("Employee")(query_employees)
+cached_query_tasks = query_cache.cached("Task", "Assignment")(query_tasks)
+cached_query_tasks_with_assignments = query_cache.cached("Task", "Assignment")(query_tasks_with_assignments)
+cached_query_assignments = query_cache.cached("Assignment")(query_assignments)
+cached_count_employees = query_cache.cached("Employee")(count_employees)
+cached_count_tasks = query_cache.cached("Task", "Assignment")(count_tasks)
+cached_count_assignments = query_cache.cached("Assignment")(count_assignments)
+cached_query_employees_window = query_cache.cached("Employee")(query_employees_window)
+cached_query_tasks_window = query_cache.cached("Task", "Assignment")(query_tasks_window)
+cached_query_assignments_window = query_cache.cached("Assignment")(query_assignments_window)
@@ -0,0 +1,118 @@
+"""
+Reports.py: Per-technician workload and revenue reports aggregated in SQL.
+Alec Shellberg
+10/18/2026
+"""
+
+from contextlib import closing
+
+from IT_Task_Manager.Database_Tier import ARCHIVE_SCHEMA, WORKLOAD_AGGREGATE_CMD
+
+# report column headings, in the order of each report row
+WORKLOAD_COLUMNS = ("EMPLOYEE_ID", "FIRST_NAME", "LAST_NAME", "OPEN", "COMPLETED",
+                    "OPEN_PRICE", "COMPLETED_PRICE", "OPEN_HOURS", "COMPLETED_HOURS")
+
+# reads the trigger-maintained summary: one row per employee whatever the history size
+WORKLOAD_SUMMARY_CMD = ("SELECT Employee.id, Employee.first_name, Employee.last_name, "
+                        "coalesce(w.open_count, 0), coalesce(w.completed_count, 0), "
+                        "coalesce(w.open_price, 0.0), coalesce(w.completed_price, 0.0), "
+                        "coalesce(w.open_hours, 0.0), coalesce(w.completed_hours, 0.0) "
+                        "FROM Employee LEFT JOIN Employee_Workload AS w ON w.employee_id = Employee.id "
+                        "ORDER BY Employee.id")
+
+# same report aggregated directly from Assignment and Task
+WORKLOAD_LIVE_CMD = ("SELECT Employee.id, Employee.first_name, Employee.last_name, "
+                     "coalesce(w.open_count, 0), coalesce(w.completed_count, 0), "
+                     "coalesce(w.open_price, 0.0), coalesce(w.completed_price, 0.0), "
+                     "coalesce(w.open_hours, 0.0), coalesce(w.completed_hours, 0.0) "
+                     "FROM Employee LEFT JOIN (" + WORKLOAD_AGGREGATE_CMD + ") AS w "
+                     "ON w.employee_id = Employee.id ORDER BY Employee.id")
+
+# the summary plus the completed work moved into the attached archive
+WORKLOAD_ARCHIVE_CMD = ("SELECT Employee.id, Employee.first_name, Employee.last_name, "
+                        "coalesce(w.open_count, 0), coalesce(w.completed_count, 0) + coalesce(a.completed_count, 0), "
+                        "coalesce(w.open_price, 0.0), coalesce(w.completed_price, 0.0) + coalesce(a.completed_price, 0.0), "
+                        "coalesce(w.open_hours, 0.0), coalesce(w.completed_hours, 0.0) + coalesce(a.completed_hours, 0.0) "
+                        "FROM Employee LEFT JOIN main.Employee_Workload AS w ON w.employee_id = Employee.id "
+                        "LEFT JOIN " + ARCHIVE_SCHEMA + ".Employee_Workload AS a ON a.employee_id = Employee.id "
+                        "ORDER BY Employee.id")
+
+
+def workload_report(conn, include_archive=False):
+    """
+    Per-technician open/completed counts, price and estimated hours from the summary table.
+    :param conn: Connection
+    :param include_archive: bool add the completed work in the attached archive
+    :return: List[tuple] rows in WORKLOAD_COLUMNS order
+    """
+    return fetch_report(conn, WORKLOAD_ARCHIVE_CMD if include_archive else WORKLOAD_SUMMARY_CMD)
+
+
+def compute_workload(conn):
+    """
+    The workload report computed with GROUP BY over the whole Assignment/Task join.
+    :param conn: Connection
+    :return: List[tuple] rows in WORKLOAD_COLUMNS order
+    """
+    return fetch_report(conn, WORKLOAD_LIVE_CMD)
+
+
+def workload_totals(rows):
+    """
+    Column totals across every technician in a workload report.
+    :param rows: List[tuple] from workload_report or compute_workload
+    :return: tuple in WORKLOAD_COLUMNS order, with blank id and name cells
+    """
+    totals = [sum(row[index] for row in rows) for index in range(3, len(WORKLOAD_COLUMNS))]
+    return ("", "Total", "") + tuple(totals)
+
+
+def fetch_report(conn, cmd):
+    """
+    :param conn: Connection
+    :param cmd: String
+    :return: List[tuple]
+    """
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute(cmd)
+            return cursor.fetchall()
+    except Exception as e:
+        print("fetch_report(): ", e)
+        return []
+
+
+def check_workload_summary(conn, tolerance=1e-6):
+    """
+    Compare the summary table against a fresh aggregate.
+    :param conn: Connection
+    :param tolerance: float allowed drift in the running price and hour sums
+    :return: List[int] ids of employees whose summary row is wrong
+    """
+    summary = {row[0]: row for row in workload_report(conn)}
+    mismatched = []
+    for row in compute_workload(conn):
+        stored = summary.get(row[0])
+        if stored is None or any(abs(stored[index] - row[index]) > tolerance
+                                 for index in range(3, len(WORKLOAD_COLUMNS))):
+            mismatched.append(row[0])
+    return mismatched
+
+
+def rebuild_workload_summary(conn):
+    """
+    Recompute Employee_Workload from scratch, e.g. to clear floating point drift in the running sums.
+    :param conn: Connection
+    :return: String
+    """
+    try:
+        with closing(conn.cursor()) as cursor:
+            cursor.execute("BEGIN")
+            cursor.execute("DELETE FROM Employee_Workload")
+            cursor.execute("INSERT INTO Employee_Workload " + WORKLOAD_AGGREGATE_CMD)
+        conn.commit()
+        return "Workload summary rebuilt."
+    except Exception as e:
+        conn.rollback()
+        print("rebuild_workload_summary(): ", e)
+        return e
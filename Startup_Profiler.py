@@ -0,0 +1,114 @@
+"""
+Startup_Profiler.py: Times the GUI cold start: imports, window creation, schema setup and each tab build.
+Alec Shellberg
+10/18/2026
+
+python -m IT_Task_Manager.Startup_Profiler
+"""
+
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# imported one after another by main, so each is charged only for the modules it pulls in first
+STARTUP_IMPORTS = ("tkinter", "sqlite3", "IT_Task_Manager.Database_Tier", "IT_Task_Manager.Help_Desk_GUI")
+
+
+class StartupProfiler:
+    """
+    Collects (phase, milliseconds) pairs and, when enabled, prints each one as it finishes
+    together with the time since start. A disabled profiler records nothing.
+    """
+    def __init__(self, enabled=True, started=None, stream=None):
+        """
+        :param enabled: bool
+        :param started: float time.perf_counter() at process start, or None for now
+        :param stream: file the phases are printed to, or None for stdout
+        """
+        self.enabled = enabled
+        self.started = time.perf_counter() if started is None else started
+        self.stream = stream
+        self.__phases = []
+        self.__lock = threading.Lock()
+
+
+    def record(self, name, elapsed_ms):
+        """
+        :param name: String
+        :param elapsed_ms: float
+        :return: None
+        """
+        if not self.enabled:
+            return
+        since_start_ms = (time.perf_counter() - self.started) * 1000
+        with self.__lock:
+            self.__phases.append((name, elapsed_ms))
+        print("startup: %-32s %9.1f ms   (at %.1f ms)" % (name, elapsed_ms, since_start_ms),
+              file=self.stream or sys.stdout, flush=True)
+
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time the body of a with statement.
+        :param name: String
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+
+    def timed(self, name, fn):
+        """
+        Wrap fn so each call is recorded as a phase, e.g. for jobs run on the database worker.
+        :param name: String
+        :param fn: function
+        :return: function
+        """
+        if not self.enabled:
+            return fn
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+
+    def mark(self, name):
+        """
+        Record a milestone as the time elapsed since start.
+        :param name: String
+        :return: None
+        """
+        self.record(name, (time.perf_counter() - self.started) * 1000)
+
+
+    def phases(self):
+        """
+        :return: List[(String, float)] phases in the order they finished
+        """
+        with self.__lock:
+            return list(self.__phases)
+
+
+def main():
+    """
+    Import the GUI module by module, then start it with profiling enabled.
+    :return: None
+    """
+    profiler = StartupProfiler()
+    for module in STARTUP_IMPORTS:
+        with profiler.phase("import " + module):
+            importlib.import_module(module)
+    from IT_Task_Manager.Help_Desk_GUI import HelpDeskGUI
+    HelpDeskGUI(profiler)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ Alec Shellberg
 """
 
 class Task:
+    # fixed attributes, no per-instance __dict__
+    __slots__ = ("__task_id", "__customer_name", "__job_desc", "__price", "__hours")
+
     def __init__(self, task_id, customer_name, job_desc, price, hours):
         self.__task_id = task_id
         self.__customer_name = customer_name
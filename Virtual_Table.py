@@ -0,0 +1,263 @@
+"""
+Virtual_Table.py: Scrollable table widget that only holds the rows currently on screen.
+Alec Shellberg
+10/18/2026
+"""
+
+import tkinter as tk
+from collections import OrderedDict
+from functools import partial
+from tkinter import ttk
+
+
+class VirtualTable(ttk.Frame):
+    """
+    ttk.Treeview showing a window of `height` rows over a result set of any size.
+    Rows are pulled from the database in blocks as the user scrolls, a few blocks are kept
+    cached, and clicking a heading re-sorts through the database query. A block is fetched by
+    seeking past the last row of the nearest block above it, so scrolling costs the same
+    however deep into the result the view is.
+    """
+    def __init__(self, parent, columns, row_values, request, height=20, block_size=200, cached_blocks=8):
+        """
+        :param parent: ttk.Frame
+        :param columns: list[(str, str)] heading text and the sort column passed to the window query
+        :param row_values: function mapping a model object to a tuple of cell values
+        :param request: function(key, fn, *args, on_done=...) running fn(conn, *args) in the background
+        :param height: int visible rows
+        :param block_size: int rows fetched per query
+        :param cached_blocks: int blocks kept in memory
+        """
+        super().__init__(parent)
+        self.__row_values = row_values
+        self.__request = request
+        self.__height = height
+        self.__block_size = block_size
+        self.__cached_blocks = cached_blocks
+        self.__blocks = OrderedDict()
+        # (sort value, id) of the last row of every block fetched so far, kept when the block itself is evicted
+        self.__block_keys = {}
+        # bumped whenever the cached blocks are dropped; window results requested before that are discarded
+        self.__generation = 0
+        self.__count_fn = None
+        self.__window_fn = None
+        self.__filters = ()
+        self.__total = 0
+        # False between reload and the count arriving; until then __total is a lower bound from the fetched blocks
+        self.__counted = False
+        self.__top = 0
+        self.__sort_columns = [sort_column for _, sort_column in columns]
+        self.__order_by = columns[0][1]
+        self.__descending = False
+        headings = [heading for heading, _ in columns]
+        self.tree = ttk.Treeview(self, columns=headings, show="headings", height=height, selectmode="browse")
+        for heading, sort_column in columns:
+            self.tree.heading(heading, text=heading, command=lambda col=sort_column: self.sort_by(col))
+            self.tree.column(heading, width=150, anchor=tk.CENTER)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scroll)
+        self.tree.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for widget in (self.tree, self.scrollbar):
+            widget.bind("<MouseWheel>", lambda event: self.scroll_to(self.__top - event.delta // 120))
+            widget.bind("<Button-4>", lambda event: self.scroll_to(self.__top - 1))
+            widget.bind("<Button-5>", lambda event: self.scroll_to(self.__top + 1))
+        self.__key = str(self)
+
+
+    def set_query(self, count_fn, window_fn, *filters):
+        """
+        Point the table at a new query and show it from the top.
+        :param count_fn: function(conn, *filters) -> int
+        :param window_fn: function(conn, offset, limit, order_by, descending, *filters, after=None) -> list,
+            after being the (sort value, id) of a row the offset is counted from
+        :param filters: filter arguments shared by both functions
+        :return: None
+        """
+        self.__count_fn = count_fn
+        self.__window_fn = window_fn
+        self.__filters = filters
+        self.__top = 0
+        self.reload()
+
+
+    def reload(self):
+        """
+        Re-count and re-fetch the current query, keeping the scroll position where possible.
+        The visible block is requested before the count, so it is shown without waiting for a count
+        whose cost grows with the table; the scrollbar is sized once the count arrives.
+        :return: None
+        """
+        if self.__count_fn is None:
+            return
+        self.clear_blocks()
+        self.__counted = False
+        self.scroll_to(self.__top)
+        self.__request(self.__key + "-count", self.__count_fn, *self.__filters, on_done=self.on_count)
+
+
+    def clear_blocks(self):
+        """
+        Drop the cached rows, and with them any window request still in flight for the old query or order.
+        :return: None
+        """
+        self.__blocks.clear()
+        self.__block_keys.clear()
+        self.__generation += 1
+
+
+    def on_count(self, total):
+        """
+        :param total: int
+        :return: None
+        """
+        self.__total = total
+        self.__counted = True
+        self.scroll_to(self.__top)
+
+
+    def sort_by(self, column):
+        """
+        Sort on column, toggling direction when it is already the sort column.
+        :param column: String
+        :return: None
+        """
+        self.__descending = not self.__descending if column == self.__order_by else False
+        self.__order_by = column
+        self.clear_blocks()
+        self.scroll_to(self.__top)
+
+
+    def apply_change(self, old_row, new_row):
+        """
+        Patch a single inserted, updated or removed row into the view without re-running the query.
+        :param old_row: tuple cell values before the write, or None if the row was outside the current filter
+        :param new_row: tuple cell values after the write, or None if the row is now outside the current filter
+        :return: None
+        """
+        if old_row is None and new_row is None:
+            return
+        sort_index = self.__sort_columns.index(self.__order_by)
+        if old_row is not None and new_row is not None and old_row[sort_index] == new_row[sort_index]:
+            # same position in the sort order: replace the cells in place
+            for rows in self.__blocks.values():
+                for position, row in enumerate(rows):
+                    if row[0] == new_row[0]:
+                        rows[position] = new_row
+            if self.tree.exists(str(new_row[0])):
+                self.tree.item(str(new_row[0]), values=new_row)
+            return
+        if old_row is None:
+            self.__total += 1
+        if new_row is None:
+            self.__total -= 1
+        if old_row is None and self.__order_by == "id" and not self.__descending:
+            # new ids sort last, so only the final block changes
+            block, position = divmod(self.__total - 1, self.__block_size)
+            if block in self.__blocks and len(self.__blocks[block]) == position:
+                self.__blocks[block].append(new_row)
+                self.__block_keys[block] = (new_row[sort_index], new_row[0])
+        else:
+            self.clear_blocks()
+        self.scroll_to(self.__top)
+
+
+    def on_scroll(self, action, amount, unit=None):
+        """
+        Scrollbar command callback.
+        :param action: String "moveto" or "scroll"
+        :param amount: String fraction for moveto, step count for scroll
+        :param unit: String "units" or "pages"
+        :return: None
+        """
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.__total))
+        elif unit == "pages":
+            self.scroll_to(self.__top + int(amount) * self.__height)
+        else:
+            self.scroll_to(self.__top + int(amount))
+
+
+    def scroll_to(self, top):
+        """
+        :param top: int index of the first visible row
+        :return: None
+        """
+        if self.__counted:
+            self.__top = max(0, min(top, self.__total - self.__height))
+        else:
+            self.__top = max(0, top)
+        missing = [block for block in self.visible_blocks() if block not in self.__blocks]
+        if missing:
+            block = missing[0]
+            generation = self.__generation
+            offset, after = self.seek_position(block)
+            self.__request(self.__key + "-window", partial(self.__window_fn, after=after), offset, self.__block_size,
+                           self.__order_by, self.__descending, *self.__filters,
+                           on_done=lambda rows: self.on_block(block, rows, generation))
+        else:
+            self.render()
+
+
+    def seek_position(self, block):
+        """
+        :param block: int
+        :return: (int offset, (sort value, id) or None) window query position of the block's first row,
+            counted from the end of the nearest block above it whose last row is known
+        """
+        known = [earlier for earlier in self.__block_keys if earlier < block]
+        if not known:
+            return block * self.__block_size, None
+        nearest = max(known)
+        return (block - nearest - 1) * self.__block_size, self.__block_keys[nearest]
+
+
+    def visible_blocks(self):
+        """
+        :return: range of block indexes covering the visible rows
+        """
+        first = self.__top // self.__block_size
+        last = (self.__top + self.__height - 1) // self.__block_size
+        return range(first, last + 1)
+
+
+    def on_block(self, block, rows, generation):
+        """
+        :param block: int
+        :param rows: list[Object]
+        :param generation: int value of the block generation when the rows were requested
+        :return: None
+        """
+        if generation != self.__generation:
+            # fetched for a query, order or data version that has since been replaced
+            return
+        self.__blocks[block] = [self.__row_values(row) for row in rows]
+        if not self.__counted:
+            # a short block ends the result; a full one shows there are at least that many rows
+            end = block * self.__block_size + len(rows)
+            self.__total = end if len(rows) < self.__block_size else max(self.__total, end)
+        if rows:
+            last = self.__blocks[block][-1]
+            self.__block_keys[block] = (last[self.__sort_columns.index(self.__order_by)], last[0])
+        while len(self.__blocks) > self.__cached_blocks:
+            self.__blocks.popitem(last=False)
+        self.scroll_to(self.__top)
+
+
+    def render(self):
+        """
+        Replace the tree items with the rows in the visible window.
+        :return: None
+        """
+        self.tree.delete(*self.tree.get_children())
+        end = min(self.__top + self.__height, self.__total)
+        for block in self.visible_blocks():
+            self.__blocks.move_to_end(block)
+        for index in range(self.__top, end):
+            block, position = divmod(index, self.__block_size)
+            rows = self.__blocks[block]
+            if position < len(rows):
+                self.tree.insert("", tk.END, iid=str(rows[position][0]), values=rows[position])
+        if self.__total > 0:
+            self.scrollbar.set(self.__top / self.__total, end / self.__total)
+        else:
+            self.scrollbar.set(0, 1)
@@ -3,10 +3,33 @@ config.py: Default Employee, Task, and Assignment objects.
 Alec Shellberg
 11/29/2025
 """
+import os
+
 from IT_Task_Manager.Assignment import Assignment
 from IT_Task_Manager.Employee import Employee
 from IT_Task_Manager.Task import Task
 
+
+def archive_path_for(database):
+    """
+    Cold storage for archived tasks and assignments: HELP_DESK_ARCHIVE_DB when set,
+    otherwise a file next to the database, e.g. Help_Desk_Archive.db beside Help_Desk.db.
+    :param database: String main database file
+    :return: String
+    """
+    return os.environ.get("HELP_DESK_ARCHIVE_DB") or os.path.splitext(database)[0] + "_Archive.db"
+
+
+# database file, overridable with the HELP_DESK_DB environment variable
+database_path = os.environ.get("HELP_DESK_DB", "Help_Desk.db")
+archive_path = archive_path_for(database_path)
+
+# calls slower than this many milliseconds are written to the slow query log
+slow_query_ms = float(os.environ.get("HELP_DESK_SLOW_QUERY_MS", "100"))
+# the log holds SQL with customer data expanded, so it is only written to a file when
+# HELP_DESK_SLOW_QUERY_LOG names one; slow calls are otherwise kept in memory for the diagnostics panel
+slow_query_log = os.environ.get("HELP_DESK_SLOW_QUERY_LOG", "")
+
 # default employees
 John = Employee(1, "John", "Johnson", "555-555-2345", "john_j@helpdesk.com")
 Jenny = Employee(2, "Jenny", "Jenson", "555-444-1234", "jenny_j@helpdesk.com")